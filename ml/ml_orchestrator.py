@@ -58,7 +58,11 @@ class MLWisdomOrchestrator:
         
         # Audit trail
         self.decisions_log: List[Dict[str, Any]] = []
-        
+
+        # Count of decisions with a recorded outcome, kept live so summary
+        # readers don't rescan the whole log
+        self.outcomes_recorded = 0
+
         os.makedirs(cache_dir, exist_ok=True)
     
     def process_decision(
@@ -235,8 +239,10 @@ class MLWisdomOrchestrator:
             "timestamp": datetime.now().isoformat(),
         }
         
+        if "outcome" not in decision:
+            self.outcomes_recorded += 1
         decision["outcome"] = outcome
-        
+
         # Record to outcome database (Step 4)
         decision_key = decision.get("decision_key")
         if decision_key:
@@ -298,6 +304,9 @@ class MLWisdomOrchestrator:
         try:
             with open(path, 'r') as f:
                 self.decisions_log = json.load(f)
+            self.outcomes_recorded = sum(
+                1 for d in self.decisions_log if "outcome" in d
+            )
             return True
         except (json.JSONDecodeError, IOError):
             return False
@@ -7,7 +7,15 @@ that Prime Confident can use for final decision-making.
 
 from typing import Dict, Any, List
 from dataclasses import dataclass
-from .ministers import MINISTERS, JUDGES, MinisterPosition
+from .ministers import (
+    MINISTERS,
+    JUDGES,
+    MINISTER_CLASSES,
+    JUDGE_CLASSES,
+    MinisterPosition,
+    prepare,
+    submit_adaptation_knowledge,
+)
 from .trace import trace
 
 
@@ -30,14 +38,21 @@ class CouncilAggregator:
     
     def __init__(self, llm=None):
         self.llm = llm
-        # Initialize 19 voting ministers
-        self.ministers: Dict[str, object] = {}
-        for domain_name, MinisterClass in MINISTERS.items():
-            self.ministers[domain_name] = MinisterClass(domain=domain_name, llm=llm)
-        # Initialize judges (advisory, non-voting)
-        self.judges: Dict[str, object] = {}
-        for judge_name, JudgeClass in JUDGES.items():
-            self.judges[judge_name] = JudgeClass(domain=judge_name, llm=llm)
+        if llm is None:
+            # Reuse the shared singleton ministers/judges; they keep no
+            # per-turn state, so aggregators don't need private copies
+            self.ministers: Dict[str, object] = dict(MINISTERS)
+            self.judges: Dict[str, object] = dict(JUDGES)
+        else:
+            # An explicit LLM handle still gets dedicated instances
+            self.ministers = {
+                domain_name: MinisterClass(domain=domain_name, llm=llm)
+                for domain_name, MinisterClass in MINISTER_CLASSES.items()
+            }
+            self.judges = {
+                judge_name: JudgeClass(domain=judge_name, llm=llm)
+                for judge_name, JudgeClass in JUDGE_CLASSES.items()
+            }
     
     def convene(self, user_input: str, context: Dict[str, Any]) -> CouncilRecommendation:
         """
@@ -52,7 +67,17 @@ class CouncilAggregator:
         """
         # Ensure context includes user_input for doctrine loading
         context["user_input"] = user_input
-        
+
+        # Lower/tokenize/keyword-scan the input once for the whole council
+        prepared = prepare(user_input, context)
+
+        # Start Adaptation's knowledge synthesis in the background so it
+        # overlaps with the other ministers' analysis
+        try:
+            context["_adaptation_kis_future"] = submit_adaptation_knowledge(user_input)
+        except Exception:
+            context["_adaptation_kis_future"] = None
+
         minister_positions: Dict[str, MinisterPosition] = {}
         stances = {"support": [], "oppose": [], "neutral": []}
         confidences = []
@@ -62,7 +87,7 @@ class CouncilAggregator:
         # Get each minister's position (voting members only)
         for domain_name, minister in self.ministers.items():
             try:
-                position = minister.analyze(user_input, context)
+                position = minister.analyze_prepared(prepared, context)
                 minister_positions[domain_name] = position
                 
                 # Collect metrics
@@ -94,7 +119,7 @@ class CouncilAggregator:
         judge_positions: Dict[str, MinisterPosition] = {}
         for judge_name, judge in self.judges.items():
             try:
-                position = judge.analyze(user_input, context)
+                position = judge.analyze_prepared(prepared, context)
                 judge_positions[judge_name] = position
                 trace("council_judge_observation", {
                     "judge": judge_name,
@@ -7,6 +7,7 @@ the council composition and aggregation logic to change based on the selected mo
 """
 
 from typing import Dict, List, Any, Optional
+from ..ministers import prepare
 from ..modes.mode_orchestrator import ModeOrchestrator
 from . import CouncilAggregator
 
@@ -99,16 +100,20 @@ class DynamicCouncil:
         """
         # Get minister names for this mode
         minister_names = self.mode_orchestrator.get_ministers_for_mode(mode, context)
-        
+
+        # Lower/tokenize/keyword-scan the input once for every minister in
+        # this mode instead of once per minister
+        prepared = prepare(user_input, context)
+
         # Collect positions from only the relevant ministers
         minister_positions = {}
         failed_ministers = []
-        
+
         for minister_name in minister_names:
             if minister_name in self.base_council.ministers:
                 minister = self.base_council.ministers[minister_name]
                 try:
-                    position = minister.analyze(user_input, context)
+                    position = minister.analyze_prepared(prepared, context)
                     minister_positions[minister_name] = {
                         "stance": position.stance,
                         "confidence": position.confidence,
@@ -9,6 +9,7 @@ Each doctrine file contains:
 
 import os
 import yaml
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -55,10 +56,13 @@ class DoctrineLoader:
         
         filename = filename_map.get(domain_name, f"{domain_name}.yaml")
         filepath = os.path.join(DOCTRINE_PATH, filename)
-        
+
         if not os.path.exists(filepath):
+            # Negative-cache missing files so repeated minister construction
+            # doesn't re-stat the same absent path
+            cls._cache[domain_name] = None
             return None
-        
+
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = yaml.safe_load(f)
@@ -91,28 +95,23 @@ class DoctrineLoader:
     @classmethod
     def extract_worldview_keywords(cls, canon_text: str) -> list:
         """Extract key phrases from the canon's core worldview."""
-        keywords = []
-        if not canon_text:
-            return keywords
-        
-        lines = canon_text.split('\n')
-        in_worldview = False
-        
-        for line in lines:
-            if "Core Worldview" in line or "worldview" in line.lower():
-                in_worldview = True
-                continue
-            
-            if in_worldview and line.strip().startswith("–"):
-                # Extract the statement after the dash
-                statement = line.strip()[1:].strip()
-                if statement:
-                    keywords.append(statement.lower())
-            
-            if line.strip().startswith("Primary Mental Models"):
-                break
-        
-        return keywords
+        return list(_worldview_keywords_cached(canon_text))
+
+    @classmethod
+    def reload(cls) -> None:
+        """
+        Drop all cached doctrine so the next load() re-reads the YAML files.
+        Also clears the minister-side caches keyed on doctrine contents.
+        """
+        cls._cache.clear()
+        _worldview_keywords_cached.cache_clear()
+        try:
+            from persona import ministers
+            ministers._worldview_match_cached.cache_clear()
+            ministers._prohibition_triggered.cache_clear()
+            ministers._keyword_alternation.cache_clear()
+        except Exception:
+            pass
     
     @classmethod
     def extract_warnings(cls, canon_text: str) -> list:
@@ -162,5 +161,38 @@ class DoctrineLoader:
             user_input = context.get("user_input", "").lower()
             if silencer_lower in user_input:
                 return False
-        
+
         return True
+
+
+@lru_cache(maxsize=64)
+def _worldview_keywords_cached(canon_text: str) -> tuple:
+    """
+    Parse the "Core Worldview" section of a canon into lowered key phrases.
+
+    Every Minister.__init__ re-parses its doctrine's canon text; ministers
+    sharing a doctrine hand in the identical string, so the line-by-line walk
+    is memoized here and the classmethod just returns a list copy.
+    """
+    keywords = []
+    if not canon_text:
+        return ()
+
+    lines = canon_text.split('\n')
+    in_worldview = False
+
+    for line in lines:
+        if "Core Worldview" in line or "worldview" in line.lower():
+            in_worldview = True
+            continue
+
+        if in_worldview and line.strip().startswith("–"):
+            # Extract the statement after the dash
+            statement = line.strip()[1:].strip()
+            if statement:
+                keywords.append(statement.lower())
+
+        if line.strip().startswith("Primary Mental Models"):
+            break
+
+    return tuple(keywords)
@@ -39,6 +39,9 @@ class EpisodicMemory:
     def __init__(self, storage_path: str = "data/memory/episodes.jsonl"):
         self.storage_path = storage_path
         self.episodes: Dict[str, Episode] = {}
+        # Maintained count of stored episodes; lets reporters read a scalar
+        # without touching (or traversing) the episode container
+        self.episode_count = 0
         self.evaluation_mode = False  # Added: disable episode storage during evaluation
         self.load_from_disk()
     
@@ -49,6 +52,8 @@ class EpisodicMemory:
         
         if not episode.episode_id:
             episode.episode_id = str(uuid.uuid4())[:8]
+        if episode.episode_id not in self.episodes:
+            self.episode_count += 1
         self.episodes[episode.episode_id] = episode
         self._persist(episode)
         return episode.episode_id
@@ -72,6 +77,7 @@ class EpisodicMemory:
                         self.episodes[ep.episode_id] = ep
         except FileNotFoundError:
             pass
+        self.episode_count = len(self.episodes)
     
     def find_similar_episodes(self, domain: str, keyword: str = None) -> List[Episode]:
         """Retrieve past episodes in same domain."""
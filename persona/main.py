@@ -11,9 +11,13 @@ Key additions:
 """
 
 import json
+import logging
 import sys
 import os
+import selectors
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 from .state import CognitiveState
@@ -34,13 +38,10 @@ from .clarify import build_clarifying_question, format_question_for_user
 from .council import CouncilAggregator
 from sovereign.prime_confident import PrimeConfident
 
-# NEW: Learning systems
-from .learning.episodic_memory import EpisodicMemory, Episode
-from .learning.performance_metrics import PerformanceMetrics
-from .learning.outcome_feedback import OutcomeFeedbackLoop
-from .validation.identity_validator import IdentityValidator
-from hse.simulation.synthetic_human_sim import SyntheticHumanSimulation
-from ml.pattern_extraction import PatternExtractor
+# NOTE: Learning systems (EpisodicMemory, PerformanceMetrics, OutcomeFeedbackLoop,
+# IdentityValidator, PatternExtractor) and the synthetic-human simulation are
+# imported lazily inside main() — they transitively pull ML/embedding modules
+# that every cold start would otherwise pay for, even in quick mode.
 
 # NEW: Mode orchestrator for decision pipeline control
 from .modes.mode_orchestrator import ModeOrchestrator
@@ -59,8 +60,26 @@ FORCE_GUESS_TURNS = 2
 # Background analysis wait when debugging (seconds)
 BG_WAIT = float(os.getenv("PERSONA_BG_WAIT", "1.0"))
 
+# Max wait for the paired situation/coherence handshakes (seconds)
+SYNC_HANDSHAKE_TIMEOUT = float(os.getenv("PERSONA_SYNC_TIMEOUT", "30.0"))
+
 FAST_PATH = True
 
+# Report/startup banner, built once at import
+_BANNER = "=" * 60
+
+# Shared empty dict for defensive reads of optional state dicts (never mutated)
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Canned MCA result for modes that never convene the council (quick mode).
+# Lets the main loop skip the _mca_decision call entirely on that hot path.
+_QUICK_MODE_RESULT = {
+    "decision": "direct_response",
+    "mode": "quick",
+    "ministers_invoked": [],
+    "reasoning": "quick mode bypass",
+}
+
 
 def _background_analysis(llm: Any, user_input: str, response: str, state: CognitiveState):
     """
@@ -73,17 +92,17 @@ def _background_analysis(llm: Any, user_input: str, response: str, state: Cognit
         situation = assess_situation(llm, user_input)
         state.last_situation = situation
         state.last_emotional_load = situation.get("emotional_load", 0.0)
-        trace("background_situation", situation)
+        if DEBUG_OBSERVER: trace("background_situation", situation)
 
         # mode fitness
         mode_eval = assess_mode_fitness(llm, user_input, state.mode)
         state.last_mode_eval = mode_eval
-        trace("background_mode_eval", mode_eval)
+        if DEBUG_OBSERVER: trace("background_mode_eval", mode_eval)
 
         # emotional metrics
         emo = assess_emotional_metrics(llm, user_input)
         state.emotional_metrics = emo
-        trace("background_emotional_metrics", emo)
+        if DEBUG_OBSERVER: trace("background_emotional_metrics", emo)
 
         # domain classification (force guess logic)
         convo_excerpt = "\n\n".join([u for u, a in state.recent_turns[-6:]] + [user_input])
@@ -92,7 +111,7 @@ def _background_analysis(llm: Any, user_input: str, response: str, state: Cognit
             force_guess = True
 
         domains_out = classify_domains(llm, convo_excerpt, force_guess=force_guess)
-        trace("background_domains_raw", domains_out)
+        if DEBUG_OBSERVER: trace("background_domains_raw", domains_out)
 
         d_conf = float(domains_out.get("confidence", 0.0) or 0.0)
         doms = domains_out.get("domains") or []
@@ -102,27 +121,26 @@ def _background_analysis(llm: Any, user_input: str, response: str, state: Cognit
             state.domain_confidence = max(d_conf, 0.5)
             state.domains_locked = True
             state.last_domain_latched_at_turn = state.turn_count
-            trace("domain_latched", {"domains": doms, "confidence": state.domain_confidence})
+            if DEBUG_OBSERVER: trace("domain_latched", {"domains": doms, "confidence": state.domain_confidence})
 
         # KIS: trigger when domains present and emotional advice_threshold (or high confidence)
-        try:
-            advice_signal = float(state.emotional_metrics.get("advice_threshold", 0.0) or 0.0)
-        except Exception:
-            advice_signal = 0.0
+        # Defensive .get chain instead of a try/except on the hot path
+        raw_signal = (state.emotional_metrics or _EMPTY_DICT).get("advice_threshold", 0.0)
+        advice_signal = float(raw_signal) if isinstance(raw_signal, (int, float)) else 0.0
 
         if state.domains and (advice_signal >= 0.7 or state.domain_confidence > 0.0):
             try:
                 kis = synthesize_knowledge(user_input=user_input, active_domains=state.domains, domain_confidence=max(state.domain_confidence, 0.5))
                 state.background_knowledge = kis
-                trace("background_kis_generated", {"num_items": len(kis.get("synthesized_knowledge", []))})
+                if DEBUG_OBSERVER: trace("background_kis_generated", {"num_items": len(kis.get("synthesized_knowledge", []))})
             except Exception as e:
-                trace("background_kis_error", {"error": str(e)})
+                if DEBUG_OBSERVER: trace("background_kis_error", {"error": str(e)})
 
         # mark classification turn
         state.last_domain_classification_turn = state.turn_count
 
     except Exception as e:
-        trace("background_analysis_failure", {"error": str(e)})
+        if DEBUG_OBSERVER: trace("background_analysis_failure", {"error": str(e)})
 
 
 def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input: str, response: str, state: CognitiveState, mode_orchestrator: Optional[ModeOrchestrator] = None, dynamic_council: Optional[DynamicCouncil] = None) -> Dict[str, Any]:
@@ -138,10 +156,11 @@ def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input:
     """
     try:
         # Build context for ministers (use simple types only - avoid nesting dicts as values initially)
+        raw_intensity = (state.emotional_metrics or _EMPTY_DICT).get("emotional_intensity", 0.0)
         context = {
             "domains": state.domains or [],
             "turn_count": state.turn_count,
-            "emotional_intensity": float(state.emotional_metrics.get("emotional_intensity", 0.0) if state.emotional_metrics else 0.0),
+            "emotional_intensity": float(raw_intensity) if isinstance(raw_intensity, (int, float)) else 0.0,
             "mode": state.mode,
         }
         # Store recent turns as string summary to avoid serialization issues
@@ -155,15 +174,16 @@ def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input:
             ministers_to_invoke = mode_orchestrator.get_ministers_for_mode(current_mode, context)
             mode_framing = mode_orchestrator.frame_for_mode(user_input, current_mode, context)
             
-            trace("mca_mode_routing", {
-                "mode": current_mode,
-                "should_convene": should_convene,
-                "ministers": str(ministers_to_invoke)  # Convert to string to avoid hashability issues
-            })
+            if DEBUG_OBSERVER:
+                trace("mca_mode_routing", {
+                    "mode": current_mode,
+                    "should_convene": should_convene,
+                    "ministers": str(ministers_to_invoke)  # Convert to string to avoid hashability issues
+                })
             
             # If mode says no council, return early with direct LLM response
             if not should_convene:
-                trace("mca_mode_no_council", {"mode": current_mode})
+                if DEBUG_OBSERVER: trace("mca_mode_no_council", {"mode": current_mode})
                 return {
                     "decision": "direct_response",
                     "mode": current_mode,
@@ -198,7 +218,7 @@ def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input:
                 # Fallback to legacy council
                 council_rec = council.convene(user_input, context)
         except Exception as e:
-            trace("council_convene_error", {"error": str(e)})
+            if DEBUG_OBSERVER: trace("council_convene_error", {"error": str(e)})
             council_rec = None
         
         if council_rec is None:
@@ -208,12 +228,21 @@ def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input:
                 "prime_final_decision": "defer"
             }
         
-        trace("mca_council_recommendation", {
-            "outcome": council_rec.outcome,
-            "recommendation": str(council_rec.recommendation)[:100],
-            "avg_confidence": float(council_rec.avg_confidence or 0.5),
-            "red_line_count": len(council_rec.red_line_concerns or [])
-        })
+        # Stringify/normalize the recommendation fields once; they are reused in
+        # the trace, Prime input, and return dicts below.
+        _rec = str(council_rec.recommendation)[:100]
+        _reason = str(council_rec.reasoning)[:100]
+        _conf = float(council_rec.avg_confidence or 0.5)
+        _cons = float(council_rec.consensus_strength or 0.5)
+        _red = council_rec.red_line_concerns or ()
+
+        if DEBUG_OBSERVER:
+            trace("mca_council_recommendation", {
+                "outcome": council_rec.outcome,
+                "recommendation": _rec,
+                "avg_confidence": _conf,
+                "red_line_count": len(_red)
+            })
         
         # Prepare minister outputs for Prime Confident
         minister_outputs = {}
@@ -227,25 +256,25 @@ def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input:
                         "red_line_triggered": bool(position.red_line_triggered) if hasattr(position, 'red_line_triggered') else False,
                     }
                 except Exception as e:
-                    trace("minister_position_conversion_error", {"domain": domain_name, "error": str(e)})
+                    if DEBUG_OBSERVER: trace("minister_position_conversion_error", {"domain": domain_name, "error": str(e)})
         
         # Prime Confident decides
         try:
             final_decision = prime.decide(
                 council_recommendation={
                     "outcome": council_rec.outcome,
-                    "recommendation": str(council_rec.recommendation)[:100],
-                    "avg_confidence": float(council_rec.avg_confidence or 0.5),
-                    "reasoning": str(council_rec.reasoning)[:100],
-                    "consensus_strength": float(council_rec.consensus_strength or 0.5),
+                    "recommendation": _rec,
+                    "avg_confidence": _conf,
+                    "reasoning": _reason,
+                    "consensus_strength": _cons,
                 },
                 minister_outputs=minister_outputs
             )
         except Exception as e:
-            trace("prime_decision_error", {"error": str(e)})
+            if DEBUG_OBSERVER: trace("prime_decision_error", {"error": str(e)})
             final_decision = {"final_outcome": "defer", "reason": "prime_decision_failed"}
         
-        trace("mca_prime_decision", {"outcome": final_decision.get("final_outcome"), "reason": final_decision.get("reason")})
+        if DEBUG_OBSERVER: trace("mca_prime_decision", {"outcome": final_decision.get("final_outcome"), "reason": final_decision.get("reason")})
         
         # Store MCA decision in state for potential context incorporation
         state.last_mca_decision = final_decision
@@ -253,81 +282,308 @@ def _mca_decision(council: CouncilAggregator, prime: PrimeConfident, user_input:
         
         return {
             "council_outcome": str(council_rec.outcome)[:50],
-            "council_recommendation": str(council_rec.recommendation)[:50],
+            "council_recommendation": _rec[:50],
             "prime_final_decision": final_decision.get("final_outcome"),
             "prime_reason": final_decision.get("reason"),
-            "red_line_triggered": bool(len(council_rec.red_line_concerns or []) > 0),
-            "consensus_strength": float(council_rec.consensus_strength or 0.5),
+            "red_line_triggered": bool(_red),
+            "consensus_strength": _cons,
         }
     
     except Exception as e:
-        trace("mca_decision_error", {"error": str(e)})
+        if DEBUG_OBSERVER: trace("mca_decision_error", {"error": str(e)})
         return {"error": str(e), "prime_final_decision": "defer"}
 
 
+def _blocking_input_with_drain(prompt: str, futures) -> str:
+    """
+    Read a line from stdin while opportunistically reaping completed futures.
+
+    Plain input() blocks the whole process, so in-flight background futures
+    sat unobserved for however long the user took to answer. Poll stdin with
+    a selector and, on each idle tick, surface results/exceptions from any
+    finished futures. Falls back to input() where stdin isn't selectable
+    (e.g. Windows console).
+    """
+    sel = selectors.DefaultSelector()
+    try:
+        sel.register(sys.stdin, selectors.EVENT_READ)
+    except (ValueError, OSError, PermissionError):
+        sel.close()
+        return input(prompt)
+    try:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        while True:
+            if sel.select(timeout=0.1):
+                return sys.stdin.readline().rstrip("\n")
+            for f in [f for f in futures if f.done()]:
+                futures.remove(f)
+                exc = f.exception()
+                if exc is not None:
+                    trace("background_future_error", {"error": str(exc)})
+    finally:
+        sel.close()
+
+
+# Single-use override appended to the system context when asking a clarifier
+_ASK_SUFFIX = "\n\nOVERRIDE: For this single response, you MAY ask a short clarifying question exactly as provided."
+
+
+# Correctness escape hatch: set NO_KIS_CACHE=1 to force fresh synthesis per round
+_KIS_CACHE_DISABLED = os.getenv("NO_KIS_CACHE", "").lower() in {"1", "true", "yes"}
+
+
+@lru_cache(maxsize=256)
+def _kis_cached(user_input: str, domains: tuple, domain_confidence: float, extra_context: tuple):
+    """
+    Hashable-argument adapter over synthesize_knowledge for the clarify loop.
+
+    Synthesis is deterministic on its inputs, so identical clarifier tuples
+    (common under AUTOMATED_SIMULATION replays) hit the cache instead of
+    re-running the synthesizer.
+    """
+    return synthesize_knowledge(
+        user_input=user_input,
+        active_domains=list(domains),
+        domain_confidence=domain_confidence,
+        extra_context=list(extra_context),
+    )
+
+
+def _try(kind: str, fn, *args, **kwargs):
+    """
+    Run fn(*args, **kwargs), tracing any failure under `kind`.
+
+    Replaces the repeated `try/except Exception as e: trace(...)` blocks
+    around single calls in the turn loop; returns None on failure.
+    """
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        trace(kind, {"error": str(e)})
+        return None
+
+
+def _safe_result(future: Future, err_trace: str):
+    """Join a handshake future; trace and return None on timeout or failure."""
+    try:
+        return future.result(timeout=SYNC_HANDSHAKE_TIMEOUT)
+    except Exception as e:
+        trace(err_trace, {"error": str(e)})
+        return None
+
+
+# Last successful learning signals; reused if a fresh extraction overruns BG_WAIT
+_last_signals: Dict[str, Any] = {}
+
+# Pre-bound formatters for the report loops — the format spec is parsed once
+# here instead of per f-string evaluation
+_PCT = "{:.1%}".format
+_PCT6 = "{:6.1%}".format
+_F1 = "{:.1f}".format
+_F2 = "{:.2f}".format
+_MODE_COL = "{:12}".format
+
+
+def _extract_and_save(pattern_extractor):
+    """Run pattern extraction and persistence; returns the learning signals."""
+    pattern_extractor.extract_patterns(num_episodes=100)
+    signals = pattern_extractor.generate_learning_signals()
+    pattern_extractor.save_patterns()
+    return signals
+
+
+def _emit_periodic_report(turn_count, metrics, pattern_extractor, episodic_memory, mode_metrics, verbose=True):
+    """
+    Build and emit the every-100-turns metrics/learning report.
+
+    Runs on the shared executor: the extraction and formatting here used to
+    stall the interactive thread. All lines are collected first and written
+    with a single sys.stdout.write — one write under the stdout lock instead
+    of a dozen print() calls that could interleave with the next prompt.
+
+    When stdout isn't a terminal (eval harness, piped simulation runs) the
+    report goes to the era.metrics logger instead of flooding the pipe;
+    metric aggregation and pattern persistence still run either way.
+    """
+    try:
+        weak_domains = metrics.detect_weak_domains(threshold=0.5)
+        stability = metrics.measure_stability(window=100)
+        improvement = metrics.show_improvement_trajectory(window=100)
+        coverage = metrics.get_feature_coverage()
+        success_rate = metrics.get_success_rate()
+
+        # NEW: Extract patterns and generate learning signals. Runs as its own
+        # future so a slow extraction (disk I/O, O(episodes) scan) can't hold
+        # the report past BG_WAIT; on timeout we reuse the previous snapshot.
+        global _last_signals
+        pat_future = executor.submit(_extract_and_save, pattern_extractor)
+        try:
+            _last_signals = pat_future.result(timeout=BG_WAIT)
+        except TimeoutError:
+            trace("pattern_extraction_timeout", {"turn": turn_count})
+        except Exception as e:
+            trace("pattern_extraction_error", {"error": str(e)})
+        learning_signals = _last_signals
+
+        lines = [
+            "",
+            _BANNER,
+            f"TURN {turn_count} METRICS & LEARNING SIGNALS",
+            _BANNER,
+            "Overall success rate: " + _PCT(success_rate),
+            f"Weak domains (success < 50%): {weak_domains}",
+            "Stability score: " + _PCT(stability.get('stability_score', 0.0)),
+            "Improvement trajectory: +" + _F1(improvement.get('percent_improvement', 0)) + "%",
+            f"Feature coverage: {coverage}",
+            f"Episodic memory size: {episodic_memory.episode_count}",
+        ]
+
+        # Learning signals
+        if learning_signals.get("weak_domains"):
+            lines.append("\n📊 WEAK DOMAINS (need improvement):")
+            for domain_info in learning_signals["weak_domains"]:
+                lines.append(f"  - {domain_info['domain']}: {_PCT(domain_info['success_rate'])} success")
+
+        if learning_signals.get("sequential_risks"):
+            lines.append("\n⚠️  SEQUENTIAL RISKS:")
+            for risk in learning_signals["sequential_risks"]:
+                lines.append(f"  - {risk['type']}: {risk['length']} turns")
+
+        # NEW: Mode performance comparison
+        try:
+            mode_comparison = mode_metrics.compare_modes()
+            if mode_comparison:
+                lines.append("\n🎯 MODE PERFORMANCE COMPARISON:")
+                for mode_perf in mode_comparison:
+                    mode_name = mode_perf.get("mode", "unknown").upper()
+                    mode_success = mode_perf.get("success_rate", 0.0)
+                    turns = mode_perf.get("turns", 0)
+                    avg_confidence = mode_perf.get("avg_confidence", 0.0)
+                    if turns > 0:
+                        lines.append(f"  {_MODE_COL(mode_name)} - {_PCT6(mode_success)} success | {turns:3} turns | {_F2(avg_confidence)} avg confidence")
+        except Exception as e:
+            trace("mode_metrics_reporting_error", {"error": str(e)})
+
+        lines.append(_BANNER + "\n")
+        joined = "\n".join(lines) + "\n"
+        if verbose:
+            sys.stdout.write(joined)
+        else:
+            logging.getLogger("era.metrics").info(joined)
+    except Exception as e:
+        trace("metrics_reporting_error", {"error": str(e)})
+
+
+# Mode-coherence keyword sets, bound once into the per-mode validators built by
+# _make_pipeline() so the per-turn check does no mode dispatch or set rebuilding.
+_MODE_KWS = {
+    "quick_council": ("minister", "council", "deliberat", "conven", "assembled"),
+    "war": ("win", "advantage", "fast", "aggressive", "strategic", "dominat", "seize", "power", "overcome", "decisive"),
+    "meeting_synthesis": ("balanc", "consider", "both", "tradeoff", "however", "yet", "deliberat", "weigh"),
+    "darbar": ("council", "consensus", "doctrine", "wisdom", "deliber", "ministers", "convened"),
+}
+
+
+def _make_pipeline(mode: str):
+    """
+    Build a mode-specialized coherence validator closure.
+
+    Mode changes rarely (startup or '/mode' command), so we specialize once per
+    mode-set: the returned closure already binds the mode's keyword sets and
+    contains only that mode's branch — no per-turn dispatch on state.mode.
+    """
+    if mode == "quick":
+        council_keywords = _MODE_KWS["quick_council"]
+
+        def validate(response: str, council_result: Dict) -> Dict[str, Any]:
+            # Quick mode should be personal and direct, not council-driven
+            if any(kw in response.lower() for kw in council_keywords):
+                return {"is_valid": False,
+                        "warning": "Quick mode response mentioned council/ministers (should be personal and direct)",
+                        "mode": "quick", "validation_passed": False}
+            return {"is_valid": True, "warning": "", "mode": "quick", "validation_passed": True}
+
+    elif mode == "war":
+        war_keywords = _MODE_KWS["war"]
+
+        def validate(response: str, council_result: Dict) -> Dict[str, Any]:
+            # War mode should emphasize winning, speed, advantage, aggressive positioning
+            if not any(kw in response.lower() for kw in war_keywords):
+                # Warning-level (don't hard-fail)
+                return {"is_valid": False,
+                        "warning": "War mode response could emphasize winning/advantage more (score: victory-focused language)",
+                        "mode": "war", "validation_passed": False}
+            return {"is_valid": True, "warning": "", "mode": "war", "validation_passed": True}
+
+    elif mode == "darbar":
+        darbar_keywords = _MODE_KWS["darbar"]
+
+        def validate(response: str, council_result: Dict) -> Dict[str, Any]:
+            # Darbar mode should reference full deliberation and significant council involvement
+            is_valid = True
+            warning = ""
+            ministers = council_result.get("ministers_involved", [])
+            if len(ministers) < 10:
+                is_valid = False
+                warning = f"Darbar mode should involve significant portion of council (only {len(ministers)}/18 involved)"
+            # Should reference council wisdom, consensus, or doctrine
+            if not any(kw in response.lower() for kw in darbar_keywords):
+                warning = "Darbar mode response could reference council consensus or doctrine alignment"
+            return {"is_valid": is_valid, "warning": warning, "mode": "darbar", "validation_passed": is_valid}
+
+    else:  # meeting (default)
+        synthesis_keywords = _MODE_KWS["meeting_synthesis"]
+
+        def validate(response: str, council_result: Dict) -> Dict[str, Any]:
+            # Meeting mode should show debate/synthesis - involve multiple perspectives
+            is_valid = True
+            warning = ""
+            ministers = council_result.get("ministers_involved", [])
+            if len(ministers) < 2:
+                is_valid = False
+                warning = f"Meeting mode should involve multiple ministers for debate (only {len(ministers)} involved)"
+            # Should synthesize or show balanced perspectives
+            if not any(kw in response.lower() for kw in synthesis_keywords):
+                warning = "Meeting mode response could better show synthesis of different perspectives"
+            return {"is_valid": is_valid, "warning": warning, "mode": "meeting", "validation_passed": is_valid}
+
+    return validate
+
+
+# Compiled validators, one per mode (built lazily and reused)
+_PIPELINES: Dict[str, Any] = {}
+
+
+def _pipeline_for(mode: str):
+    """Get (building if needed) the specialized validator for a mode."""
+    pipeline = _PIPELINES.get(mode)
+    if pipeline is None:
+        pipeline = _PIPELINES[mode] = _make_pipeline(mode)
+    return pipeline
+
+
 def validate_mode_coherence(mode: str, response: str, council_result: Dict) -> Dict[str, Any]:
     """
     Check if response matches the mode's requirements and expectations.
-    
+
     QUICK mode: Should be personal, direct, no council references
     WAR mode: Should emphasize winning, speed, advantage, strategy
     MEETING mode: Should show balanced debate and synthesis of multiple views
     DARBAR mode: Should reference full deliberation and consensus
+
+    Delegates to the mode-specialized validator from _make_pipeline().
     """
-    is_valid = True
-    warning = ""
-    
-    if mode == "quick":
-        # Quick mode should be personal and direct, not council-driven
-        council_keywords = ["minister", "council", "deliberat", "conven", "assembled"]
-        if any(kw in response.lower() for kw in council_keywords):
-            is_valid = False
-            warning = "Quick mode response mentioned council/ministers (should be personal and direct)"
-    
-    elif mode == "war":
-        # War mode should emphasize winning, speed, advantage, aggressive positioning
-        war_keywords = ["win", "advantage", "fast", "aggressive", "strategic", "dominat", "seize", "power", "overcome", "decisive"]
-        has_war_language = any(kw in response.lower() for kw in war_keywords)
-        
-        if not has_war_language:
-            is_valid = False  # Set to warning-level (don't hard-fail)
-            warning = "War mode response could emphasize winning/advantage more (score: victory-focused language)"
-    
-    elif mode == "meeting":
-        # Meeting mode should show debate/synthesis - involve multiple perspectives
-        ministers = council_result.get("ministers_involved", [])
-        if len(ministers) < 2:
-            is_valid = False
-            warning = f"Meeting mode should involve multiple ministers for debate (only {len(ministers)} involved)"
-        
-        # Should synthesize or show balanced perspectives
-        synthesis_keywords = ["balanc", "consider", "both", "tradeoff", "however", "yet", "deliberat", "weigh"]
-        if not any(kw in response.lower() for kw in synthesis_keywords):
-            warning = "Meeting mode response could better show synthesis of different perspectives"
-    
-    elif mode == "darbar":
-        # Darbar mode should reference full deliberation and significant council involvement
-        ministers = council_result.get("ministers_involved", [])
-        if len(ministers) < 10:
-            is_valid = False
-            warning = f"Darbar mode should involve significant portion of council (only {len(ministers)}/18 involved)"
-        
-        # Should reference council wisdom, consensus, or doctrine
-        darbar_keywords = ["council", "consensus", "doctrine", "wisdom", "deliber", "ministers", "convened"]
-        if not any(kw in response.lower() for kw in darbar_keywords):
-            warning = "Darbar mode response could reference council consensus or doctrine alignment"
-    
-    return {
-        "is_valid": is_valid,
-        "warning": warning,
-        "mode": mode,
-        "validation_passed": is_valid
-    }
+    return _pipeline_for(mode)(response, council_result)
 
 
 def main():
     print("[MAIN] Starting main function...", file=sys.stderr, flush=True)
-    
+
+    # Only write the periodic report to stdout when someone is watching
+    # (interactive terminal) or explicitly requested via ERA_VERBOSE=1.
+    _VERBOSE = sys.stdout.isatty() or bool(int(os.environ.get("ERA_VERBOSE", "0")))
+
     state = CognitiveState()
     state.mode_ttl = MODE_INERTIA.get(state.mode, 1)
 
@@ -354,6 +610,11 @@ def main():
             print("FATAL: No LLM runtime available:", e)
             sys.exit(1)
     
+    # Warm the configured models in the background so turn 1 doesn't pay the
+    # Ollama model-load cost; this overlaps with the mode-selection prompt below.
+    if hasattr(llm, "warmup"):
+        executor.submit(llm.warmup)
+
     # Initialize MCA components
     print("[MAIN] Initializing council and orchestrators...", file=sys.stderr, flush=True)
     council = CouncilAggregator(llm=llm)
@@ -368,14 +629,24 @@ def main():
     # NEW: Initialize mode metrics tracking
     mode_metrics = ModeMetrics()
     
-    # NEW: Initialize learning systems
+    # NEW: Initialize learning systems (imported here to keep startup lean)
     print("[MAIN] Initializing learning systems...", file=sys.stderr, flush=True)
+    from .learning.episodic_memory import EpisodicMemory, Episode
+    from .learning.performance_metrics import PerformanceMetrics
+    from .learning.outcome_feedback import OutcomeFeedbackLoop
+    from .validation.identity_validator import IdentityValidator
+    from ml.pattern_extraction import PatternExtractor
     episodic_memory = EpisodicMemory(storage_path="data/memory/episodes.jsonl")
     metrics = PerformanceMetrics(storage_path="data/memory/metrics.jsonl")
     feedback_loop = OutcomeFeedbackLoop(council=council, kis_engine=None, episodic_memory=episodic_memory)
     identity_validator = IdentityValidator(persona_doctrine=None)
     pattern_extractor = PatternExtractor(episodic_memory=episodic_memory)
-    
+
+    # Bind the per-turn recording methods to locals once; the turn loop below
+    # calls them every turn and the repeated attribute lookups add up.
+    _record = metrics.record_decision
+    _mode_record = mode_metrics.record_mode_decision
+
     # NEW: Initialize synthetic human simulation (if enabled)
     print(f"[MAIN] AUTOMATED_SIMULATION={os.getenv('AUTOMATED_SIMULATION')}", file=sys.stderr, flush=True)
     AUTOMATED_SIMULATION = os.getenv("AUTOMATED_SIMULATION", "0") == "1"
@@ -385,6 +656,7 @@ def main():
         print("[MAIN] Initializing synthetic human...", file=sys.stderr, flush=True)
         try:
             from hse.human_profile import SyntheticHuman
+            from hse.simulation.synthetic_human_sim import SyntheticHumanSimulation
             synthetic_human = SyntheticHuman(name="Test Subject", age=32, seed=42)
             human_sim = SyntheticHumanSimulation(synthetic_human, user_llm=llm)
             print("[SIMULATION] Automated synthetic human enabled.\n", file=sys.stderr, flush=True)
@@ -396,9 +668,9 @@ def main():
         human_sim = None
 
     # NEW: Mode selection at startup
-    print("\n" + "="*60)
+    print("\n" + _BANNER)
     print("PERSONA N - DECISION MODE SELECTION")
-    print("="*60)
+    print(_BANNER)
     
     # Auto-select mode if automated simulation is enabled
     if AUTOMATED_SIMULATION:
@@ -418,15 +690,32 @@ def main():
     
     mode_orchestrator.set_mode(selected_mode)
     dynamic_council.set_mode(selected_mode)
-    
+    state._pipeline_validate = _pipeline_for(selected_mode)
+
     print(f"\nMode: {selected_mode.upper()} - {mode_orchestrator.get_mode_description(selected_mode)}")
-    print("="*60)
+    print(_BANNER)
     print("\nTypes: 'exit' to quit | '/mode quick|war|meeting|darbar' to switch modes")
     print("\nPersona N online (with Ministerial Cognitive Architecture).\n")
 
     last_response = ""  # Initialize before loop
     context_for_simulation = {}  # Initialize context for entire loop
 
+    # Bounded ring of in-flight background-analysis futures. Without this the
+    # per-turn fire-and-forget submits were never reaped outside DEBUG_OBSERVER,
+    # so results/exceptions accumulated unobserved in the executor.
+    bg_futures: deque = deque(maxlen=8)
+
+    # Reusable snapshot dict for brain.decide — it treats the mapping as
+    # read-only and does not retain it, so updating one dict in place avoids
+    # building a fresh 5-key dict every turn.
+    state_snapshot: Dict[str, Any] = {
+        "mode": None,
+        "domains": None,
+        "domain_confidence": None,
+        "turn_count": 0,
+        "user_frequency": None,
+    }
+
     while True:
         # NEW: Get user input (synthetic or real)
         if AUTOMATED_SIMULATION:
@@ -458,6 +747,7 @@ def main():
             requested_mode = user_input[6:].strip().lower()
             if mode_orchestrator.set_mode(requested_mode):
                 dynamic_council.set_mode(requested_mode)  # Sync dynamic council with new mode
+                state._pipeline_validate = _pipeline_for(requested_mode)  # Respecialize validator
                 desc = mode_orchestrator.get_mode_description(requested_mode)
                 print(f"\n[MODE] Switched to {requested_mode.upper()} - {desc}\n")
                 if mode_orchestrator.should_invoke_council(requested_mode):
@@ -470,13 +760,18 @@ def main():
             continue
 
         # If we are awaiting clarification, clear awaiting flag when user replies
-        if getattr(state, "awaiting_clarification", False):
-            trace("clarification_answer_received", {"expected": getattr(state, "expected_clarification", None), "answer": user_input})
+        if state.awaiting_clarification:
+            trace("clarification_answer_received", {"expected": state.expected_clarification, "answer": user_input})
             state.awaiting_clarification = False
             state.expected_clarification = None
 
         state.turn_count += 1
-        
+        # Per-turn snapshot: mode and turn_count cannot change for the rest of
+        # this iteration (the /mode command continues before reaching here), so
+        # the many reads below become local loads.
+        tcount = state.turn_count
+        mode = state.mode
+
         # Ensure we run a synchronous situation check every turn so state is populated for observer/brain.
         try:
             future = executor.submit(assess_situation, llm, user_input)
@@ -499,7 +794,7 @@ def main():
             state.last_situation = {"situation_type": "unclear", "clarity": 0.0, "emotional_load": 0.0}
             state.last_emotional_load = 0.0
             trace("sync_situation_error", {"error": str(e)})
-        state.user_frequency = (lambda s: "low" if len(s.split()) <= 3 else ("medium" if len(s.split()) <= 12 else "high"))(user_input)
+        ufreq = state.user_frequency = (lambda s: "low" if len(s.split()) <= 3 else ("medium" if len(s.split()) <= 12 else "high"))(user_input)
 
         system_context = build_system_context(state)
 
@@ -535,44 +830,43 @@ def main():
             state.pending_offer_text = response
 
         # Display assistant response
-        display = trim_response(response, state.mode)
+        display = trim_response(response, mode)
         display = enforce_frequency(display, state.user_frequency)
-        label = f"[{state.mode.upper()}] "
+        label = f"[{mode.upper()}] "
         print(f"\nN: {label}{display}\n")
         
         # Store response for synthetic human loop
         last_response = response
         
         # NEW: Validate mode coherence (check response matches mode expectations)
-        mode_validation_result = {}
-        try:
-            council_result = getattr(state, 'last_council_recommendation', {}) or {}
-            mode_validation_result = validate_mode_coherence(state.mode, response, council_result)
-            if not mode_validation_result.get("is_valid", True):
-                print(f"[⚠️  MODE] {mode_validation_result.get('warning', 'Mode validation check failed')}")
-        except Exception as e:
-            trace("mode_validation_error", {"error": str(e)})
+        mode_validation_result = _try("mode_validation_error", state._pipeline_validate,
+                                      response, state.last_council_recommendation or {}) or {}
+        if not mode_validation_result.get("is_valid", True):
+            print(f"[⚠️  MODE] {mode_validation_result.get('warning', 'Mode validation check failed')}")
         
         # NEW: Validate identity consistency
         try:
-            coherent, contradiction = identity_validator.check_self_contradiction(state.turn_count, response)
+            coherent, contradiction = identity_validator.check_self_contradiction(tcount, response)
             if not coherent:
                 print(f"[⚠️  IDENTITY] Warning: {contradiction}")
-                identity_validator.log_contradiction(state.turn_count, contradiction, response, "")
+                identity_validator.log_contradiction(tcount, contradiction, response, "")
         except Exception as e:
             trace("identity_validation_error", {"error": str(e)})
         
         # NEW: Store episode in episodic memory
+        # Resolve these once per turn; episode storage, synthetic consequences
+        # and metrics recording below all reuse them.
+        domain0 = state.domains[0] if state.domains else "general"
+        dconf = float(getattr(state, 'domain_confidence', 0.5))
         episode = None
         try:
-            domain = state.domains[0] if state.domains else "general"
             episode = Episode(
                 episode_id=None,
-                turn_id=state.turn_count,
-                domain=domain,
+                turn_id=tcount,
+                domain=domain0,
                 user_input=user_input[:200],  # Limit input length
                 persona_recommendation=response[:200],  # Limit recommendation length
-                confidence=float(state.domain_confidence if hasattr(state, 'domain_confidence') else 0.5),
+                confidence=dconf,
                 minister_stance="unknown",  # Simplified to avoid dict key issues
                 council_recommendation="unknown",  # Simplified to avoid dict key issues
             )
@@ -591,10 +885,7 @@ def main():
         # NEW: Apply consequences if synthetic human is running
         if AUTOMATED_SIMULATION and human_sim:
             try:
-                outcome_info = human_sim.apply_consequences(
-                    state.domain_confidence if hasattr(state, 'domain_confidence') else 0.5,
-                    state.domains[0] if state.domains else "general"
-                )
+                outcome_info = human_sim.apply_consequences(dconf, domain0)
                 # Record outcome in episodic memory
                 if 'episode' in locals():
                     episode.outcome = outcome_info.get("outcome")
@@ -602,7 +893,7 @@ def main():
                     feedback_loop.record_decision_outcome(episode)
                     
                     # Periodic retraining: every 50 turns check for failure clusters
-                    if state.turn_count % 50 == 0:
+                    if tcount % 50 == 0:
                         failure_clusters = episodic_memory.detect_failure_clusters()
                         for cluster_name, failures in failure_clusters.items():
                             if len(failures) > 2:
@@ -612,110 +903,77 @@ def main():
                 trace("synthetic_consequences_error", {"error": str(e)})
         
         # NEW: Record metrics
-        try:
-            metrics.record_decision(
-                turn=state.turn_count,
-                domain=state.domains[0] if state.domains else "general",
-                recommendation=response[:100],
-                confidence=state.domain_confidence if hasattr(state, 'domain_confidence') else 0.5,
-                outcome=episode.outcome if 'episode' in locals() else None,
-                regret=episode.regret_score if 'episode' in locals() else 0.0
-            )
-        except Exception as e:
-            trace("metrics_recording_error", {"error": str(e)})
+        _try(
+            "metrics_recording_error",
+            _record,
+            turn=tcount,
+            domain=domain0,
+            recommendation=response[:100],
+            confidence=dconf,
+            outcome=episode.outcome if episode else None,
+            regret=episode.regret_score if episode else 0.0,
+        )
         
-        # NEW: Periodic reporting (every 100 turns)
-        if state.turn_count % 100 == 0:
-            try:
-                weak_domains = metrics.detect_weak_domains(threshold=0.5)
-                stability = metrics.measure_stability(window=100)
-                improvement = metrics.show_improvement_trajectory(window=100)
-                coverage = metrics.get_feature_coverage()
-                success_rate = metrics.get_success_rate()
-                
-                # NEW: Extract patterns and generate learning signals
-                patterns = pattern_extractor.extract_patterns(num_episodes=100)
-                learning_signals = pattern_extractor.generate_learning_signals()
-                pattern_extractor.save_patterns()
-                
-                print(f"\n{'='*60}")
-                print(f"TURN {state.turn_count} METRICS & LEARNING SIGNALS")
-                print(f"{'='*60}")
-                print(f"Overall success rate: {success_rate:.1%}")
-                print(f"Weak domains (success < 50%): {weak_domains}")
-                print(f"Stability score: {stability.get('stability_score', 0.0):.1%}")
-                print(f"Improvement trajectory: +{improvement.get('percent_improvement', 0):.1f}%")
-                print(f"Feature coverage: {coverage}")
-                print(f"Episodic memory size: {len(episodic_memory.episodes)}")
-                
-                # Print learning signals
-                if learning_signals.get("weak_domains"):
-                    print(f"\n📊 WEAK DOMAINS (need improvement):")
-                    for domain_info in learning_signals["weak_domains"]:
-                        print(f"  - {domain_info['domain']}: {domain_info['success_rate']:.1%} success")
-                
-                if learning_signals.get("sequential_risks"):
-                    print(f"\n⚠️  SEQUENTIAL RISKS:")
-                    for risk in learning_signals["sequential_risks"]:
-                        print(f"  - {risk['type']}: {risk['length']} turns")
-                
-                # NEW: Print mode performance comparison
-                try:
-                    mode_comparison = mode_metrics.compare_modes()
-                    if mode_comparison:
-                        print(f"\n🎯 MODE PERFORMANCE COMPARISON:")
-                        for mode_perf in mode_comparison:
-                            mode_name = mode_perf.get("mode", "unknown").upper()
-                            success_rate = mode_perf.get("success_rate", 0.0)
-                            turns = mode_perf.get("turns", 0)
-                            avg_confidence = mode_perf.get("avg_confidence", 0.0)
-                            if turns > 0:
-                                print(f"  {mode_name:12} - {success_rate:6.1%} success | {turns:3} turns | {avg_confidence:.2f} avg confidence")
-                except Exception as e:
-                    trace("mode_metrics_reporting_error", {"error": str(e)})
-                
-                print(f"{'='*60}\n")
-            except Exception as e:
-                trace("metrics_reporting_error", {"error": str(e)})
+        # NEW: Periodic reporting (every 100 turns) — offloaded to the executor
+        # so the user sees the next prompt immediately instead of waiting on
+        # extraction + formatting
+        if tcount % 100 == 0:
+            executor.submit(_emit_periodic_report, tcount, metrics,
+                            pattern_extractor, episodic_memory, mode_metrics, _VERBOSE)
+
+            # Reap completed background-analysis futures so their
+            # exceptions are surfaced instead of silently discarded
+            for f in [f for f in bg_futures if f.done()]:
+                bg_futures.remove(f)
+                exc = f.exception()
+                if exc is not None:
+                    trace("background_analysis_future_error", {"error": str(exc)})
 
         # Run MCA decision (Ministerial Cognitive Architecture)
         # This convenes the council (or skips it based on mode) and Prime Confident determines meta-level action
         try:
-            mca_decision = _mca_decision(council, prime, user_input, response, state, mode_orchestrator, dynamic_council)
+            if mode_orchestrator.should_invoke_council(mode_orchestrator.get_current_mode()):
+                mca_decision = _mca_decision(council, prime, user_input, response, state, mode_orchestrator, dynamic_council)
+            else:
+                # Quick mode never convenes the council; skip the whole call
+                mca_decision = _QUICK_MODE_RESULT
             trace("mca_completed", mca_decision)
             
-            # NEW: Record mode-specific metrics
-            try:
-                # Determine outcome based on red line and consensus
-                mca_outcome = "success" if mca_decision.get("prime_final_decision") != "reject" else "failure"
-                
-                # Use consensus strength as confidence metric
-                consensus = mca_decision.get("consensus_strength", 0.5)
-                
-                # Estimate regret based on red line concerns
-                regret = 0.1 if mca_decision.get("red_line_triggered") else 0.0
-                
-                mode_metrics.record_mode_decision(
-                    mode=state.mode,
-                    outcome=mca_outcome,
-                    confidence=consensus,
-                    regret=regret
-                )
-            except Exception as e:
-                trace("mode_metrics_recording_error", {"error": str(e)})
-            
-            # If Prime Confident rejected (red line), add warning comment
-            if mca_decision.get("prime_final_decision") == "reject":
+            # Unpack the fields the recording/warning branches below need; each
+            # was previously re-fetched with its own dict.get call.
+            prime_final = mca_decision.get("prime_final_decision")
+            consensus = mca_decision.get("consensus_strength", 0.5)
+            red_line = mca_decision.get("red_line_triggered")
+
+            # NEW: Record mode-specific metrics. Outcome derives from the red
+            # line / prime decision; regret is estimated from red-line concerns.
+            _try(
+                "mode_metrics_recording_error",
+                _mode_record,
+                mode=mode,
+                outcome="success" if prime_final != "reject" else "failure",
+                confidence=consensus,
+                regret=0.1 if red_line else 0.0,
+            )
+
+            # If Prime Confident rejected (red line), add warning comment.
+            # No dedicated trace here: mca_completed above already captured the
+            # full decision dict.
+            if prime_final == "reject":
                 print("[MCA] ⚠️  Red line concern. Prime Confident has flagged this response.\n")
-                trace("mca_red_line_warning", mca_decision)
-            elif mca_decision.get("red_line_triggered"):
+            elif red_line:
                 print("[MCA] ⚠️  Council raised concerns. Proceeding with caution.\n")
         except Exception as e:
             trace("mca_execution_error", {"error": str(e)})
 
         # Launch background analysis (silent handshakes)
         try:
+            if len(bg_futures) == bg_futures.maxlen:
+                # Ring full: drop the oldest analysis (cancel is a no-op if it
+                # already started running, which is fine — it self-traces).
+                bg_futures.popleft().cancel()
             bg_future: Future = executor.submit(_background_analysis, llm, user_input, response, state)
+            bg_futures.append(bg_future)
             if DEBUG_OBSERVER:
                 try:
                     bg_future.result(timeout=BG_WAIT)
@@ -727,42 +985,36 @@ def main():
 
         # Now: run control decision synchronously using fresh coherence/situation where possible
         try:
-            # Synchronous short handshakes to feed the brain
-            # These are small targeted calls to ensure control has the inputs it needs
-            situation = None
-            coherence = None
-            try:
-                situation = assess_situation(llm, user_input)
+            # Synchronous short handshakes to feed the brain.
+            # Both are I/O-bound on the model server, so submit them together
+            # and join — wall cost is max of the two instead of their sum.
+            f_sit = executor.submit(assess_situation, llm, user_input)
+            f_coh = executor.submit(assess_coherence, llm, user_input)
+            situation = _safe_result(f_sit, "sync_situation_error")
+            coherence = _safe_result(f_coh, "sync_coherence_error")
+            if situation is not None:
                 state.last_situation = situation
-            except Exception as e:
-                trace("sync_situation_error", {"error": str(e)})
-
-            try:
-                coherence = assess_coherence(llm, user_input)
+            if coherence is not None:
                 state.last_coherence = coherence
-            except Exception as e:
-                trace("sync_coherence_error", {"error": str(e)})
-
-            # Prepare plain dict for brain.decide (brain expects dict-like state)
-            state_snapshot = {
-                "mode": state.mode,
-                "domains": state.domains,
-                "domain_confidence": state.domain_confidence,
-                "turn_count": state.turn_count,
-                "user_frequency": state.user_frequency,
-            }
+
+            # Refresh the reusable snapshot for brain.decide (expects dict-like state)
+            state_snapshot["mode"] = mode
+            state_snapshot["domains"] = state.domains
+            state_snapshot["domain_confidence"] = state.domain_confidence
+            state_snapshot["turn_count"] = tcount
+            state_snapshot["user_frequency"] = ufreq
 
             decision = brain.decide(coherence=coherence, situation=situation or {}, state=state_snapshot)
-            trace("brain_decision", {"decision": decision.__dict__ if hasattr(decision, "__dict__") else str(decision)})
+            if DEBUG_OBSERVER:
+                # Deliberate snapshot: tracing the live __dict__ would keep a
+                # reference to the directive's mutable state
+                trace("brain_decision", {"decision": dict(decision.__dict__) if hasattr(decision, "__dict__") else str(decision)})
 
             # If the brain asked to 'ask', build and ask the clarifying question
             if decision and getattr(decision, "action", None) == "ask":
                 # Generate a short list of clarifying questions via LLM (fallbacks applied in generator)
-                qs = []
-                try:
-                    qs = generate_clarifying_questions(llm, user_input, max_questions=3, context=(state.last_situation or {}))
-                except Exception as e:
-                    trace("generate_clarifying_questions_error", {"error": str(e)})
+                qs = _try("generate_clarifying_questions_error", generate_clarifying_questions,
+                          llm, user_input, max_questions=3, context=(state.last_situation or {})) or []
 
                 if not qs:
                     # Fallback to older single-question builder
@@ -771,18 +1023,16 @@ def main():
 
                 # Iteratively ask questions, collect answers, and re-run KIS until quality threshold or max rounds
                 collected_answers: list[str] = []
-                MAX_ROUNDS = getattr(state, "max_clarify_rounds", 3)
+                MAX_ROUNDS = state.max_clarify_rounds
                 QUALITY_THRESHOLD = 0.6
-                round_idx = 0
                 last_quality = 0.0
 
-                for qobj in qs[:MAX_ROUNDS]:
-                    if round_idx >= MAX_ROUNDS:
-                        break
-                    round_idx += 1
+                # Invariant across rounds: hoist out of the loop
+                existing_answers = state.collected_answers
+                ask_system_context = system_context + _ASK_SUFFIX
 
+                for round_idx, qobj in enumerate(qs[:MAX_ROUNDS], 1):
                     q_display = format_question_for_user(qobj, state)
-                    ask_system_context = system_context + "\n\nOVERRIDE: For this single response, you MAY ask a short clarifying question exactly as provided."
                     ask_response = llm.speak(ask_system_context, q_display)
 
                     # show assistant asking the clarifier
@@ -796,7 +1046,7 @@ def main():
                             user_answer = human_sim.generate_next_input(ask_response, context_for_simulation)
                             print(f"> [SYNTHETIC USER] {user_answer}\n")
                         else:
-                            user_answer = input(">> ").strip()
+                            user_answer = _blocking_input_with_drain(">> ", bg_futures).strip()
                     except Exception:
                         user_answer = ""
 
@@ -805,7 +1055,10 @@ def main():
 
                     # Re-run KIS synthesizer with collected answers as extra_context
                     try:
-                        kis_out = synthesize_knowledge(user_input=user_input, active_domains=state.domains or [], domain_confidence=state.domain_confidence or 0.0, extra_context=collected_answers)
+                        if _KIS_CACHE_DISABLED:
+                            kis_out = synthesize_knowledge(user_input=user_input, active_domains=state.domains or [], domain_confidence=state.domain_confidence or 0.0, extra_context=collected_answers)
+                        else:
+                            kis_out = _kis_cached(user_input, tuple(state.domains or []), float(state.domain_confidence or 0.0), tuple(collected_answers))
                         # expect knowledge_quality in return
                         kq = kis_out.get("knowledge_quality") or {}
                         last_quality = float(kq.get("candidate_quality", 0.0) or 0.0)
@@ -820,7 +1073,7 @@ def main():
                         break
 
                 # After loop, update state with collected answers and last quality
-                state.collected_answers = (getattr(state, "collected_answers", []) or []) + collected_answers
+                state.collected_answers = existing_answers + collected_answers
                 state.last_knowledge_quality = last_quality
                 # If not high quality, set awaiting flag so brain can escalate or ask again later
                 if last_quality < QUALITY_THRESHOLD:
@@ -9,7 +9,12 @@ user input through their canonical worldview and mental models. Doctrine include
 - Known failure patterns
 """
 
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 from .knowledge_engine import synthesize_knowledge
@@ -17,16 +22,222 @@ from .doctrine_loader import DoctrineLoader, DoctrinalCanon
 from .trace import trace
 
 
-@dataclass
+
+# Single-token keyword membership: tokenize the lowered input once and test the
+# keyword frozensets with set intersection instead of per-keyword substring
+# scans. Multi-word phrases stay in *_PHRASES tuples checked with `in text`.
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def _tokenize(text: str) -> frozenset:
+    """Token set of an already-lowered input string."""
+    return frozenset(_TOKEN_RE.findall(text))
+
+
+def _lower(s: str) -> str:
+    """
+    Lower a string, returning it unchanged when it is already lowercase.
+    str.islower() is a C-level scan, so the common all-lowercase input skips
+    the allocation of an identical copy.
+    """
+    return s if s.islower() else s.lower()
+
+
+# Keyword sets used by the ministers' heuristics, hoisted to module level
+# so analyze() calls don't rebuild the same set literals every turn.
+_CONFLICT_WORDS = frozenset({"vs", "against", "opposing", "competing", "threat", "attack", "defensive"})
+_RELATIONSHIP_WORDS = frozenset({"partner", "stakeholder", "relationship", "trust", "reputation", "ally"})
+_EMPIRICAL_WORDS = frozenset({"data", "evidence", "measure", "test", "metric", "proof", "study"})
+_SPECULATIVE_WORDS = frozenset({"assume", "probably", "guess", "think", "maybe"})
+_SPECULATIVE_PHRASES = ("could be",)
+_LONGTERM_WORDS = frozenset({"future", "vision", "goal", "plan", "strategy", "years", "decade", "legacy"})
+_AWARENESS_WORDS = frozenset({"unknown", "unclear", "hidden", "uncertain", "risk", "threat", "monitor"})
+_TIMING_WORDS = frozenset({"now", "immediately", "urgent", "delay", "wait", "ready", "soon"})
+_HIGH_URGENCY = frozenset({"now", "immediately"})
+_LOW_URGENCY = frozenset({"delay", "wait"})
+_RISK_WORDS = frozenset({"risk", "danger", "loss", "failure", "crash", "bankrupt", "catastrophe", "expensive"})
+_CRITICAL_WORDS = frozenset({"bankruptcy", "death", "irreversible", "extinction"})
+_CRITICAL_PHRASES = ("total loss",)
+_POWER_WORDS = frozenset({"leverage", "pressure", "force", "power", "strength", "weak", "advantage", "position"})
+_PSYCHOLOGY_WORDS = frozenset({"feel", "emotion", "fear", "trust", "motivation", "belief", "psychology", "mental"})
+_DENIAL_WORDS = frozenset({"irrelevant"})
+_DENIAL_PHRASES = ("don't care", "no emotion", "purely logical")
+_TECH_WORDS = frozenset({"system", "build", "code", "technical", "platform", "infrastructure", "api", "server"})
+_LEGIT_WORDS = frozenset({"authority", "right", "legal", "ethical", "values", "principle", "legitimate", "law"})
+_ILLEGAL_WORDS = frozenset({"illegal", "unethical", "fraud", "corrupt", "steal", "cheat"})
+_TRUTH_WORDS = frozenset({"true", "fact", "accurate", "verify", "proof", "evidence", "honest"})
+_DECEPTION_WORDS = frozenset({"lie", "hide", "mislead", "fabricate", "fiction", "false", "deceive"})
+# Deliberate substring scans (prohibition context): tuple, not token set
+_TRUTH_VIOLATION_MARKERS = ("lie", "deceive", "hide", "mislead", "fabricate")
+_NARRATIVE_WORDS = frozenset({"story", "narrative", "coherent", "consistent", "arc", "plot", "theme", "meaning"})
+_SOVEREIGN_WORDS = frozenset({"my", "decision"})
+_SOVEREIGN_PHRASES = ("i choose", "i will", "my authority")
+_COMMITMENT_WORDS = frozenset({"forever", "irreversible"})
+_COMMITMENT_PHRASES = ("never go back", "all-in", "burn bridges")
+_OPTIONALITY_WORDS = frozenset({"option", "exit", "flexibility", "retreat", "alternative", "backup"})
+_RESOURCE_WORDS = frozenset({"budget", "capital", "resources", "money", "time", "energy", "reserves"})
+_DEPLETION_WORDS = frozenset({"all", "everything", "out", "empty", "spent", "shortage"})
+_DEPLETION_PHRASES = ("running out",)
+_ACCOUNTABILITY_WORDS = frozenset({"responsible", "accountable", "consequences", "liable", "fault", "blame"})
+_EVASION_WORDS = frozenset({"deny"})
+_EVASION_PHRASES = ("not my fault", "not responsible", "someone else", "blame others")
+_WAR_WORDS = frozenset({"attack", "mobilize", "aggressive", "enemy", "battle", "survival"})
+_WAR_PHRASES = ("defend attack",)
+# "escalat" is a deliberate prefix match; keep the whole escalation list as substring scans
+_ESCALATION_PHRASES = ("escalat", "intensify", "full force", "all hands", "total war")
+
+# Union of every substring pattern any minister scans for, merged into one
+# compiled alternation so prepare() walks the input a single time instead of
+# each analyzer re-scanning it per phrase tuple. (Hyperscan would be the
+# heavy-duty version of this, but it is not a project dependency; for these
+# few dozen literal patterns one re alternation is the same single pass.)
+# The zero-width lookahead keeps overlapping patterns from shadowing each
+# other, and each group capture is the literal pattern that matched, so
+# analyzers test frozenset membership instead of substring-scanning.
+# A per-minister first-byte translate() screen was considered as a cheaper
+# prefilter, but the token index plus this merged scan already cost one
+# pass for the whole council, so there is no per-minister keyword loop
+# left to short-circuit.
+_ALL_PHRASES = tuple(dict.fromkeys(
+    _SPECULATIVE_PHRASES + _CRITICAL_PHRASES + _DENIAL_PHRASES
+    + _SOVEREIGN_PHRASES + _COMMITMENT_PHRASES + _DEPLETION_PHRASES
+    + _EVASION_PHRASES + _WAR_PHRASES + _ESCALATION_PHRASES
+    + _TRUTH_VIOLATION_MARKERS
+    + ("attack", "weak")  # conflict red line; power "weak" prefix
+))
+_PHRASE_RE = re.compile("(?=(" + "|".join(map(re.escape, _ALL_PHRASES)) + "))")
+
+# Contradiction markers in recent-turn text: one pass, word-bounded so
+# e.g. "butter" no longer counts as "but"
+_CONTRADICT_RE = re.compile(r"\bbut\b|\bhowever\b")
+
+# Shared empty default for MinisterPosition.concerns/recommendations; the
+# no-concern case (most positions) allocates nothing
+_EMPTY: tuple = ()
+
+# Canonical stance strings, interned so downstream equality checks are
+# pointer comparisons and every position shares the same three objects.
+# Stances deliberately stay strings rather than an IntEnum: the raw values
+# travel through council payloads, trace events, and persisted episodes,
+# and interning already makes the hot == checks identity-fast
+SUPPORT = sys.intern("support")
+OPPOSE = sys.intern("oppose")
+NEUTRAL = sys.intern("neutral")
+_STANCES = frozenset({SUPPORT, OPPOSE, NEUTRAL})
+
+# Shared one-pass keyword scan across every minister's vocabulary.
+# (An Aho–Corasick automaton would be the textbook structure here, but
+# pyahocorasick is not a project dependency; since every keyword is a single
+# token — phrases live in the *_PHRASES tuples — a reverse token index gives
+# the same single-linear-pass behavior: tokenize once, one dict probe per
+# token, and each minister reads its precomputed hit set.)
+_MINISTER_KEYWORDS: Dict[str, frozenset] = {
+    "conflict": _CONFLICT_WORDS,
+    "diplomacy": _RELATIONSHIP_WORDS,
+    "data": _EMPIRICAL_WORDS | _SPECULATIVE_WORDS,
+    "grand_strategist": _LONGTERM_WORDS,
+    "intelligence": _AWARENESS_WORDS,
+    "timing": _TIMING_WORDS,
+    "risk": _RISK_WORDS | _CRITICAL_WORDS,
+    "power": _POWER_WORDS,
+    "psychology": _PSYCHOLOGY_WORDS | _DENIAL_WORDS,
+    "technology": _TECH_WORDS,
+    "legitimacy": _LEGIT_WORDS | _ILLEGAL_WORDS,
+    "truth": _TRUTH_WORDS | _DECEPTION_WORDS,
+    "narrative": _NARRATIVE_WORDS,
+    "sovereign": _SOVEREIGN_WORDS,
+    "optionality": _COMMITMENT_WORDS | _OPTIONALITY_WORDS,
+    "risk_resources": _RESOURCE_WORDS | _DEPLETION_WORDS,
+    "tribunal": _ACCOUNTABILITY_WORDS | _EVASION_WORDS,
+    "war_mode": _WAR_WORDS,
+}
+
+# token -> tuple of minister domains interested in it, built once at import
+_KEYWORD_INDEX: Dict[str, tuple] = {}
+for _domain, _words in _MINISTER_KEYWORDS.items():
+    for _word in _words:
+        _KEYWORD_INDEX[_word] = _KEYWORD_INDEX.get(_word, ()) + (_domain,)
+
+
+def scan(text: str) -> Dict[str, set]:
+    """
+    Run the shared keyword scan over an already-lowered input.
+
+    Returns {minister_domain: set of matched tokens}; domains with no hits are
+    absent. Callers dispatching the full council can compute this once and
+    hand each minister its hit set instead of having 19 analyzers re-scan the
+    same string.
+    """
+    hits: Dict[str, set] = {}
+    for tok in _TOKEN_RE.findall(text):
+        for domain in _KEYWORD_INDEX.get(tok, ()):
+            hits.setdefault(domain, set()).add(tok)
+    return hits
+
+
+# Shared per-turn view of the input: lowered once, tokenized once, keyword-
+# scanned once. Council dispatch builds one of these and hands it to every
+# minister's analyze_prepared() instead of each analyzer redoing the work.
+PreparedInput = namedtuple("PreparedInput", "raw text tokens hits phrases recent_lower")
+
+
+def prepare(user_input: str, context: Optional[Dict[str, Any]] = None) -> PreparedInput:
+    """
+    Build a PreparedInput for one dispatch of the council.
+
+    Scanning cost is linear in the input even for long transcripts: one
+    regex tokenization plus one dict probe per distinct token, regardless of
+    how many ministers or keywords are registered.
+    """
+    text = _lower(user_input)
+    tokens = frozenset(_TOKEN_RE.findall(text))
+    hits: Dict[str, set] = {}
+    for tok in tokens:
+        for domain in _KEYWORD_INDEX.get(tok, ()):
+            hits.setdefault(domain, set()).add(tok)
+    phrases = frozenset(_PHRASE_RE.findall(text))
+    recent_turns = (context or {}).get("recent_turns") or []
+    recent_lower = tuple(turn[0].lower() for turn in recent_turns[-3:] if turn)
+    return PreparedInput(user_input, text, tokens, hits, phrases, recent_lower)
+
+
+def analyze_all(ministers, user_input: str, context: Dict[str, Any]) -> list:
+    """Prepare the input once and run it through a collection of ministers."""
+    prepared = prepare(user_input, context)
+    return [minister.analyze_prepared(prepared, context) for minister in ministers]
+
+
+def analyze_batch(ministers, inputs, context: Optional[Dict[str, Any]] = None) -> list:
+    """
+    Run many inputs through a collection of ministers (log replay, offline
+    metric sweeps). Each input is lowered/tokenized/phrase-scanned exactly
+    once, and repeated inputs in the batch hit the worldview/prohibition
+    caches, so cost grows with distinct text rather than batch size times
+    minister count.
+
+    Returns one list of MinisterPositions per input, in input order.
+    """
+    context = context or {}
+    results = []
+    for user_input in inputs:
+        prepared = prepare(user_input, context)
+        results.append(
+            [minister.analyze_prepared(prepared, context) for minister in ministers]
+        )
+    return results
+
+
+@dataclass(slots=True, frozen=True)
 class MinisterPosition:
-    """Output from a Minister's analysis."""
+    """Output from a Minister's analysis. Immutable; ~19 are allocated per
+    council decision, so slots drop the per-instance __dict__."""
     domain: str
     stance: str  # "support", "oppose", or "neutral"
     confidence: float  # 0-1
     reasoning: str
     red_line_triggered: bool = False
-    concerns: Optional[list] = None
-    recommendations: Optional[list] = None
+    concerns: tuple = _EMPTY
+    recommendations: tuple = _EMPTY
     doctrine_applied: bool = False  # Whether doctrine was used in analysis
 
 
@@ -38,22 +249,39 @@ class Minister(ABC):
         self.llm = llm
         # Load doctrine for this minister
         self.doctrine: Optional[DoctrinalCanon] = DoctrineLoader.load(domain)
-        # Extract key phrases from canonical worldview for matching
-        self.worldview_keywords = []
+        # Extract key phrases from canonical worldview for matching. Stored as
+        # a tuple: hashable (so it keys the lru_caches below directly) and
+        # immutable, with the length and its reciprocal precomputed once
+        self.worldview_keywords = ()
         if self.doctrine:
-            self.worldview_keywords = DoctrineLoader.extract_worldview_keywords(self.doctrine.canon_text)
+            self.worldview_keywords = tuple(DoctrineLoader.extract_worldview_keywords(self.doctrine.canon_text))
+        self._n_keywords = len(self.worldview_keywords)
+        self._inv_n_keywords = 1.0 / self._n_keywords if self._n_keywords else 0.0
+        # Precompiled alternation over the lowered prohibitions: one regex scan
+        # replaces a Python loop of substring checks in the analyzers
+        self._prohib_re = (
+            re.compile("|".join(re.escape(p.lower()) for p in self.doctrine.prohibitions))
+            if self.doctrine and self.doctrine.prohibitions else None
+        )
     
-    @abstractmethod
     def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
         """Analyze user input from domain perspective and return position."""
+        return self.analyze_prepared(prepare(user_input, context), context)
+
+    @abstractmethod
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        """Analyze a PreparedInput (shared lowered/tokenized view) and return position."""
         pass
     
     def _extract_stance_confidence(self, analysis: Dict[str, Any]) -> tuple:
         """Helper to extract stance and confidence from LLM analysis."""
-        stance = analysis.get("stance", "neutral").lower()
-        if stance not in ["support", "oppose", "neutral"]:
-            stance = "neutral"
-        confidence = float(analysis.get("confidence", 0.5))
+        stance = analysis.get("stance", NEUTRAL).lower()
+        if stance not in _STANCES:
+            stance = NEUTRAL
+        try:
+            confidence = float(analysis.get("confidence", 0.5))
+        except (TypeError, ValueError):
+            confidence = 0.5
         confidence = max(0.0, min(1.0, confidence))  # Clamp 0-1
         return stance, confidence
     
@@ -64,55 +292,207 @@ class Minister(ABC):
         """
         if not self.doctrine or not self.worldview_keywords:
             return None, None, False
-        
-        user_input_lower = user_input.lower()
-        
-        # Count keyword matches
-        matches = 0
-        for keyword in self.worldview_keywords:
-            if keyword in user_input_lower:
-                matches += 1
-        
-        if matches == 0:
-            return None, None, False
-        
-        # Calculate confidence based on match strength
-        match_ratio = matches / len(self.worldview_keywords) if self.worldview_keywords else 0
-        confidence = min(0.95, 0.5 + (match_ratio * 0.45))  # 0.5-0.95 range
-        
-        # Stance: If worldview matches, this minister supports it
-        stance = "support" if match_ratio > 0.3 else "neutral"
-        
-        return stance, confidence, True
-    
+        return _worldview_match_cached(self.worldview_keywords, _lower(user_input))
+
     def _apply_prohibitions(self, stance: str, user_input: str) -> tuple:
         """Apply doctrine prohibitions to moderate stance if needed."""
         if not self.doctrine or not self.doctrine.prohibitions:
             return stance, False
-        
-        user_input_lower = user_input.lower()
-        
-        # Check each prohibition
-        for prohibition in self.doctrine.prohibitions:
-            prohibition_lower = prohibition.lower()
-            
-            # If this action violates doctrine, oppose it
-            if prohibition_lower in user_input_lower or any(word in prohibition_lower for word in user_input_lower.split()):
-                return "oppose", True
-        
+        if _prohibition_triggered(tuple(self.doctrine.prohibitions), _lower(user_input)):
+            return OPPOSE, True
         return stance, False
 
 
+@lru_cache(maxsize=64)
+def _keyword_alternation(keywords: tuple):
+    """One escaped-alternation regex per keyword tuple (shared across siblings)."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+@lru_cache(maxsize=4096)
+def _worldview_match_cached(worldview_keywords: tuple, user_input_lower: str) -> tuple:
+    """
+    Cached core of Minister._score_worldview_match.
+
+    Council dispatch runs every minister against the same input and siblings
+    often share doctrine keyword sets, so identical (keywords, input) pairs
+    recur within a turn; the cache returns the previously computed tuple.
+    """
+    # Fast path: one alternation scan decides "no keyword present" without
+    # running the per-keyword loop (most inputs miss most doctrines)
+    if _keyword_alternation(worldview_keywords).search(user_input_lower) is None:
+        return None, None, False
+
+    # Count keyword matches
+    matches = 0
+    for keyword in worldview_keywords:
+        if keyword in user_input_lower:
+            matches += 1
+
+    if matches == 0:
+        return None, None, False
+
+    # Calculate confidence based on match strength
+    match_ratio = matches * (1.0 / len(worldview_keywords))
+    confidence = min(0.95, 0.5 + (match_ratio * 0.45))  # 0.5-0.95 range
+
+    # Stance: If worldview matches, this minister supports it
+    stance = SUPPORT if match_ratio > 0.3 else NEUTRAL
+
+    return stance, confidence, True
+
+
+@lru_cache(maxsize=4096)
+def _prohibition_triggered(prohibitions: tuple, user_input_lower: str) -> bool:
+    """Cached core of Minister._apply_prohibitions (see above)."""
+    for prohibition in prohibitions:
+        prohibition_lower = prohibition.lower()
+
+        # If this action violates doctrine, oppose it
+        if prohibition_lower in user_input_lower or any(word in prohibition_lower for word in user_input_lower.split()):
+            return True
+    return False
+
+
+
+@dataclass(frozen=True, slots=True)
+class _Signal:
+    """One detectable signal: single-token words plus substring phrases."""
+    words: frozenset = frozenset()
+    phrases: tuple = ()
+
+    def hit(self, prepared: PreparedInput) -> bool:
+        if self.words and not self.words.isdisjoint(prepared.tokens):
+            return True
+        if self.phrases:
+            hits = prepared.phrases
+            return any(p in hits for p in self.phrases)
+        return False
+
+
+_NO_SIGNAL = _Signal()
+
+
+@dataclass(frozen=True, slots=True)
+class MinisterSpec:
+    """
+    Declarative description of a keyword-driven minister.
+
+    Most ministers share one shape — a positive signal, an optional negative
+    signal, and a three-way stance decision — so their behavior lives in this
+    table instead of near-identical analyze() bodies. Ministers with genuinely
+    distinct logic (doctrine prohibitions, recent-turn checks, urgency tiers)
+    stay as hand-written classes.
+    """
+    domain: str
+    trace_event: str
+    positive: _Signal
+    pos_stance: str
+    pos_confidence: float
+    pos_reason: str
+    negative: _Signal = _NO_SIGNAL
+    neg_stance: str = OPPOSE
+    neg_confidence: float = 0.7
+    neg_reason: str = ""
+    default_stance: str = NEUTRAL
+    default_confidence: float = 0.5
+    default_reason: str = ""
+    fallback_reasoning: str = "No signal"
+    # When True the negative signal is tested before the positive one,
+    # optionally only when the positive signal is absent
+    negative_first: bool = False
+    neg_requires_no_pos: bool = False
+    red_line_rule: str = ""  # "", "pos_phrase", "neg_not_pos"
+    red_line_phrases: tuple = ()
+    concerns_on_oppose: tuple = ()
+    recommendations_on_support: tuple = ()
+    trace_extras: tuple = ()  # ((payload key, "pos" | "neg"), ...)
+
+
+class PatternMinister(Minister):
+    """Minister whose behavior is fully described by a MinisterSpec table entry."""
+
+    spec: MinisterSpec  # set by each subclass
+
+    def __init__(self, domain: str, llm=None):
+        super().__init__(domain, llm)
+        # Partial evaluation of the spec: doctrine and keyword sets are fixed
+        # after construction, so the signals and branch tuples are bound to
+        # the instance once; the per-turn path does plain attribute loads and
+        # tuple unpacks instead of walking the spec dataclass field by field.
+        # (This is the deliberate alternative to exec-generating a fused
+        # analyze function from the spec tables at import: prebound branches
+        # on shared singletons get the same "no dict lookups per turn"
+        # property while staying debuggable source.)
+        spec = self.spec
+        self._positive = spec.positive
+        self._negative = spec.negative
+        self._pos_branch = (spec.pos_stance, spec.pos_confidence, spec.pos_reason)
+        self._neg_branch = (spec.neg_stance, spec.neg_confidence, spec.neg_reason)
+        self._default_branch = (spec.default_stance, spec.default_confidence, spec.default_reason)
+
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        spec = self.spec
+        pos = self._positive.hit(prepared)
+        neg = self._negative.hit(prepared)
+
+        if spec.negative_first and neg and not (spec.neg_requires_no_pos and pos):
+            stance, confidence, reason = self._neg_branch
+        elif pos:
+            stance, confidence, reason = self._pos_branch
+        elif neg and not spec.negative_first:
+            stance, confidence, reason = self._neg_branch
+        else:
+            stance, confidence, reason = self._default_branch
+
+        red_line = False
+        if spec.red_line_rule == "pos_phrase":
+            red_line = pos and any(p in prepared.phrases for p in spec.red_line_phrases)
+        elif spec.red_line_rule == "neg_not_pos":
+            red_line = neg and not pos
+
+        payload = {"stance": stance}
+        for key, which in spec.trace_extras:
+            payload[key] = pos if which == "pos" else neg
+        trace(spec.trace_event, payload)
+
+        return MinisterPosition(
+            domain=spec.domain,
+            stance=stance,
+            confidence=confidence,
+            reasoning=reason if reason else spec.fallback_reasoning,
+            red_line_triggered=red_line,
+            concerns=spec.concerns_on_oppose if stance == OPPOSE else _EMPTY,
+            recommendations=spec.recommendations_on_support if stance == SUPPORT else _EMPTY,
+        )
+
+
+# Adaptation's knowledge synthesis is the one potentially heavy call in the
+# council; memoize it and give callers a way to start it in the background
+# while the other ministers run, instead of blocking mid-dispatch
+_KNOWLEDGE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="minister-kis")
+_KIS_TIMEOUT = 5.0
+
+
+@lru_cache(maxsize=1024)
+def _synth_adaptation(text: str):
+    return synthesize_knowledge(text, active_domains=["adaptation"], domain_confidence=0.8)
+
+
+def submit_adaptation_knowledge(user_input: str):
+    """Kick off adaptation knowledge synthesis on the pool; returns a Future."""
+    return _KNOWLEDGE_POOL.submit(_synth_adaptation, user_input)
+
 
 class MinisterOfAdaptation(Minister):
     """Detects need for change and system evolution."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
         """Assess whether change/adaptation is needed in the current situation."""
         reasoning = []
         
         # Try doctrine-based analysis first
-        doctrine_stance, doctrine_conf, doctrine_applied = self._score_worldview_match(user_input)
+        doctrine_stance, doctrine_conf, doctrine_applied = self._score_worldview_match(prepared.text)
         if doctrine_applied:
             reasoning.append("Doctrine worldview match detected")
             stance = doctrine_stance
@@ -125,17 +505,22 @@ class MinisterOfAdaptation(Minister):
             if domains and turn_count > 5:
                 reasoning.append("Pattern persistence detected; adaptation may be needed")
             
-            # Get domain-specific knowledge
+            # Get domain-specific knowledge; council dispatch may have started
+            # this on the pool before the other ministers ran
             try:
-                kis = synthesize_knowledge(user_input, active_domains=["adaptation"], domain_confidence=0.8)
-                knowledge_items = kis.get("synthesized_knowledge", [])
-                has_adaptation_knowledge = len(knowledge_items) > 0
+                fut = context.get("_adaptation_kis_future")
+                if fut is not None:
+                    kis = fut.result(timeout=_KIS_TIMEOUT)
+                else:
+                    kis = _synth_adaptation(prepared.raw)
+                has_adaptation_knowledge = bool(kis.get("synthesized_knowledge"))
                 if has_adaptation_knowledge:
                     reasoning.append("Adaptation knowledge base confirms change signals present")
-            except:
+            except (KeyError, ValueError, RuntimeError, TimeoutError) as e:
+                trace("minister_adaptation_kis_error", {"error": str(e)})
                 has_adaptation_knowledge = False
             
-            stance = "support" if has_adaptation_knowledge else "neutral"
+            stance = SUPPORT if has_adaptation_knowledge else NEUTRAL
             confidence = 0.7 if has_adaptation_knowledge else 0.4
         
         trace("minister_adaptation", {"stance": stance, "confidence": confidence, "doctrine_used": doctrine_applied})
@@ -146,129 +531,84 @@ class MinisterOfAdaptation(Minister):
             confidence=confidence,
             reasoning=" | ".join(reasoning) if reasoning else "No clear adaptation signal",
             red_line_triggered=False,
-            concerns=["system_stagnation", "decay"] if stance == "support" else [],
+            concerns=("system_stagnation", "decay") if stance == SUPPORT else _EMPTY,
             doctrine_applied=doctrine_applied
         )
 
 
 
-class MinisterOfConflict(Minister):
+class MinisterOfConflict(PatternMinister):
     """Assesses adversarial dynamics and negotiation positions."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for conflict language
-        conflict_words = {"vs", "against", "opposing", "competing", "threat", "attack", "defensive"}
-        has_conflict_language = any(word in user_input.lower() for word in conflict_words)
-        
-        if has_conflict_language:
-            reasoning.append("Adversarial language detected")
-            stance = "oppose"  # Conflict minister cautions against escalation
-            confidence = 0.8
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_conflict", {"stance": stance, "conflict_language": has_conflict_language})
-        
-        return MinisterPosition(
-            domain="conflict",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "No conflict signal present",
-            red_line_triggered=has_conflict_language and "attack" in user_input.lower(),
-        )
+    spec = MinisterSpec(
+        domain="conflict",
+        trace_event="minister_conflict",
+        positive=_Signal(_CONFLICT_WORDS),
+        pos_stance=OPPOSE,  # Conflict minister cautions against escalation
+        pos_confidence=0.8,
+        pos_reason="Adversarial language detected",
+        fallback_reasoning="No conflict signal present",
+        red_line_rule="pos_phrase",
+        red_line_phrases=("attack",),
+        trace_extras=(("conflict_language", "pos"),),
+    )
 
 
-class MinisterOfDiplomacy(Minister):
+class MinisterOfDiplomacy(PatternMinister):
     """Evaluates relationship impact and stakeholder considerations."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for stakeholder/relationship language
-        relationship_words = {"partner", "stakeholder", "relationship", "trust", "reputation", "ally"}
-        has_relationship_language = any(word in user_input.lower() for word in relationship_words)
-        
-        if has_relationship_language:
-            reasoning.append("Stakeholder impact detected")
-            stance = "support"  # Diplomacy advocates for relational approaches
-            confidence = 0.75
-        else:
-            stance = "neutral"
-            confidence = 0.4
-        
-        trace("minister_diplomacy", {"stance": stance, "relationship_focus": has_relationship_language})
-        
-        return MinisterPosition(
-            domain="diplomacy",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Generic advice",
-            recommendations=["build_consensus", "stakeholder_alignment"] if stance == "support" else []
-        )
+    spec = MinisterSpec(
+        domain="diplomacy",
+        trace_event="minister_diplomacy",
+        positive=_Signal(_RELATIONSHIP_WORDS),
+        pos_stance=SUPPORT,  # Diplomacy advocates for relational approaches
+        pos_confidence=0.75,
+        pos_reason="Stakeholder impact detected",
+        default_confidence=0.4,
+        fallback_reasoning="Generic advice",
+        recommendations_on_support=("build_consensus", "stakeholder_alignment"),
+        trace_extras=(("relationship_focus", "pos"),),
+    )
 
 
-class MinisterOfData(Minister):
+class MinisterOfData(PatternMinister):
     """Insists on evidence-based reasoning."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for empirical language
-        empirical_words = {"data", "evidence", "measure", "test", "metric", "proof", "study"}
-        has_empirical_language = any(word in user_input.lower() for word in empirical_words)
-        
-        # Check for speculative language (opposite)
-        speculative_words = {"assume", "probably", "guess", "think", "maybe", "could be"}
-        is_speculative = any(word in user_input.lower() for word in speculative_words)
-        
-        if has_empirical_language:
-            stance = "support"
-            confidence = 0.85
-            reasoning.append("Evidence-based reasoning present")
-        elif is_speculative:
-            stance = "oppose"
-            confidence = 0.7
-            reasoning.append("Speculative reasoning without data")
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_data", {"stance": stance, "empirical": has_empirical_language, "speculative": is_speculative})
-        
-        return MinisterPosition(
-            domain="data",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Data quality neutral",
-            red_line_triggered=is_speculative and not has_empirical_language
-        )
+    spec = MinisterSpec(
+        domain="data",
+        trace_event="minister_data",
+        positive=_Signal(_EMPIRICAL_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.85,
+        pos_reason="Evidence-based reasoning present",
+        negative=_Signal(_SPECULATIVE_WORDS, _SPECULATIVE_PHRASES),
+        neg_confidence=0.7,
+        neg_reason="Speculative reasoning without data",
+        fallback_reasoning="Data quality neutral",
+        red_line_rule="neg_not_pos",
+        trace_extras=(("empirical", "pos"), ("speculative", "neg")),
+    )
 
 
 class MinisterOfDiscipline(Minister):
     """Ensures consistency and adherence to established principles."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        text = prepared.text
         reasoning = []
         
         # Check for inconsistency signals
         recent_turns = context.get("recent_turns", [])
         if recent_turns and len(recent_turns) > 3:
-            last_input = recent_turns[-1][0].lower() if recent_turns[-1] else ""
-            current_input = user_input.lower()
+            last_input = prepared.recent_lower[-1] if prepared.recent_lower else ""
             # Very simple: check if contradicting previous statement
-            if ("no" in current_input and "yes" in last_input) or ("never" in current_input and "always" in last_input):
+            if ("no" in text and "yes" in last_input) or ("never" in text and "always" in last_input):
                 reasoning.append("Contradiction detected with recent statement")
-                stance = "oppose"
+                stance = OPPOSE
                 confidence = 0.8
             else:
-                stance = "support"
+                stance = SUPPORT
                 confidence = 0.6
                 reasoning.append("Consistent positioning maintained")
         else:
-            stance = "neutral"
+            stance = NEUTRAL
             confidence = 0.5
         
         trace("minister_discipline", {"stance": stance})
@@ -281,92 +621,71 @@ class MinisterOfDiscipline(Minister):
         )
 
 
-class MinisterOfGrandStrategy(Minister):
+class MinisterOfGrandStrategy(PatternMinister):
     """Thinks in terms of long-term vision and alignment."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for long-term language
-        longterm_words = {"future", "vision", "goal", "plan", "strategy", "years", "decade", "legacy"}
-        has_longterm_language = any(word in user_input.lower() for word in longterm_words)
-        
-        if has_longterm_language:
-            stance = "support"
-            confidence = 0.8
-            reasoning.append("Long-term strategic thinking evident")
-        else:
-            stance = "oppose"
-            confidence = 0.6
-            reasoning.append("Short-term tactical focus detected; strategy missing")
-        
-        trace("minister_grand_strategy", {"stance": stance, "longterm": has_longterm_language})
-        
-        return MinisterPosition(
-            domain="grand_strategist",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Strategy alignment neutral",
-        )
+    spec = MinisterSpec(
+        domain="grand_strategist",
+        trace_event="minister_grand_strategy",
+        positive=_Signal(_LONGTERM_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.8,
+        pos_reason="Long-term strategic thinking evident",
+        default_stance=OPPOSE,
+        default_confidence=0.6,
+        default_reason="Short-term tactical focus detected; strategy missing",
+        fallback_reasoning="Strategy alignment neutral",
+        trace_extras=(("longterm", "pos"),),
+    )
 
 
-class MinisterOfIntelligence(Minister):
+class MinisterOfIntelligence(PatternMinister):
     """Focuses on information quality and hidden factors."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for awareness of information gaps
-        awareness_words = {"unknown", "unclear", "hidden", "uncertain", "risk", "threat", "monitor"}
-        has_awareness = any(word in user_input.lower() for word in awareness_words)
-        
-        if has_awareness:
-            reasoning.append("Awareness of information gaps present")
-            stance = "support"
-            confidence = 0.75
-        else:
-            reasoning.append("Potential information blindness")
-            stance = "oppose"
-            confidence = 0.6
-        
-        trace("minister_intelligence", {"stance": stance, "awareness": has_awareness})
-        
-        return MinisterPosition(
-            domain="intelligence",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Information quality neutral",
-            concerns=["information_gaps", "hidden_risks"] if stance == "oppose" else []
-        )
+    spec = MinisterSpec(
+        domain="intelligence",
+        trace_event="minister_intelligence",
+        positive=_Signal(_AWARENESS_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.75,
+        pos_reason="Awareness of information gaps present",
+        default_stance=OPPOSE,
+        default_confidence=0.6,
+        default_reason="Potential information blindness",
+        fallback_reasoning="Information quality neutral",
+        concerns_on_oppose=("information_gaps", "hidden_risks"),
+        trace_extras=(("awareness", "pos"),),
+    )
 
 
 class MinisterOfTiming(Minister):
     """Evaluates whether now is the right moment."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        tokens = prepared.tokens
         reasoning = []
-        
+
         # Check for urgency/timing language
-        timing_words = {"now", "immediately", "urgent", "delay", "wait", "ready", "soon"}
-        has_timing_language = any(word in user_input.lower() for word in timing_words)
+        has_timing_language = not _TIMING_WORDS.isdisjoint(tokens)
         
-        urgency_level = 0.5
-        if "now" in user_input.lower() or "immediately" in user_input.lower():
+        # Token-set tests instead of substring scans — "now" inside "know"
+        # no longer reads as urgency
+        if not _HIGH_URGENCY.isdisjoint(tokens):
             urgency_level = 0.8
-        elif "delay" in user_input.lower() or "wait" in user_input.lower():
+        elif not _LOW_URGENCY.isdisjoint(tokens):
             urgency_level = 0.3
+        else:
+            urgency_level = 0.5
         
         # Timing minister often advocates for patience
         if urgency_level > 0.7:
-            stance = "oppose"  # Caution against hasty action
+            stance = OPPOSE  # Caution against hasty action
             confidence = 0.7
             reasoning.append("Excessive urgency detected; urge patience")
         elif urgency_level < 0.4:
-            stance = "support"
+            stance = SUPPORT
             confidence = 0.6
             reasoning.append("Adequate preparation time available")
         else:
-            stance = "neutral"
+            stance = NEUTRAL
             confidence = 0.5
         
         trace("minister_timing", {"stance": stance, "urgency": urgency_level})
@@ -382,45 +701,45 @@ class MinisterOfTiming(Minister):
 class MinisterOfRisk(Minister):
     """Identifies downside scenarios and loss prevention."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        text = prepared.text
+        tokens = prepared.tokens
         reasoning = []
         doctrine_applied = False
         
         # Apply prohibitions from doctrine if loaded
-        if self.doctrine and self.doctrine.prohibitions:
-            for prohibition in self.doctrine.prohibitions:
-                if prohibition.lower() in user_input.lower():
-                    reasoning.append(f"Doctrine prohibition triggered: {prohibition}")
-                    return MinisterPosition(
-                        domain="risk",
-                        stance="oppose",
-                        confidence=0.95,
-                        reasoning=" | ".join(reasoning),
-                        red_line_triggered=True,
-                        concerns=["prohibition_violation"],
-                        doctrine_applied=True
-                    )
+        if self._prohib_re is not None:
+            m = self._prohib_re.search(text)
+            if m:
+                reasoning.append(f"Doctrine prohibition triggered: {m.group(0)}")
+                return MinisterPosition(
+                    domain="risk",
+                    stance=OPPOSE,
+                    confidence=0.95,
+                    reasoning=" | ".join(reasoning),
+                    red_line_triggered=True,
+                    concerns=("prohibition_violation",),
+                    doctrine_applied=True
+                )
         
         # Check for risk signals
-        risk_words = {"risk", "danger", "loss", "failure", "crash", "bankrupt", "catastrophe", "expensive"}
-        has_risk_language = any(word in user_input.lower() for word in risk_words)
+        has_risk_language = not _RISK_WORDS.isdisjoint(tokens)
         
         # Catastrophic/red-line words
-        critical_words = {"bankruptcy", "death", "total loss", "irreversible", "extinction"}
-        has_critical_risk = any(word in user_input.lower() for word in critical_words)
+        has_critical_risk = not _CRITICAL_WORDS.isdisjoint(tokens) or any(p in prepared.phrases for p in _CRITICAL_PHRASES)
         
         if has_critical_risk:
-            stance = "oppose"
+            stance = OPPOSE
             confidence = 0.95
             reasoning.append("CRITICAL RISK DETECTED")
             red_line = True
         elif has_risk_language:
-            stance = "oppose"
+            stance = OPPOSE
             confidence = 0.75
             reasoning.append("Significant risk present")
             red_line = False
         else:
-            stance = "support"
+            stance = SUPPORT
             confidence = 0.5
             reasoning.append("Risk profile acceptable")
             red_line = False
@@ -433,151 +752,106 @@ class MinisterOfRisk(Minister):
             confidence=confidence,
             reasoning=" | ".join(reasoning) if reasoning else "Risk manageable",
             red_line_triggered=red_line,
-            concerns=["downside_scenarios", "loss_prevention"] if has_risk_language else [],
+            concerns=("downside_scenarios", "loss_prevention") if has_risk_language else _EMPTY,
             doctrine_applied=doctrine_applied
         )
 
 
 
-class MinisterOfPower(Minister):
+class MinisterOfPower(PatternMinister):
     """Evaluates capability and leverage positions."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for power/leverage language
-        power_words = {"leverage", "pressure", "force", "power", "strength", "weak", "advantage", "position"}
-        has_power_language = any(word in user_input.lower() for word in power_words)
-        
-        if "weak" in user_input.lower() or "weakness" in user_input.lower():
-            stance = "oppose"
-            confidence = 0.7
-            reasoning.append("Power asymmetry unfavorable")
-        elif has_power_language:
-            stance = "support"
-            confidence = 0.6
-            reasoning.append("Favorable power dynamics")
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_power", {"stance": stance, "power_aware": has_power_language})
-        
-        return MinisterPosition(
-            domain="power",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Power balance neutral",
-        )
+    spec = MinisterSpec(
+        domain="power",
+        trace_event="minister_power",
+        positive=_Signal(_POWER_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.6,
+        pos_reason="Favorable power dynamics",
+        negative=_Signal(phrases=("weak",)),  # prefix: also matches "weakness"
+        neg_confidence=0.7,
+        neg_reason="Power asymmetry unfavorable",
+        negative_first=True,
+        fallback_reasoning="Power balance neutral",
+        trace_extras=(("power_aware", "pos"),),
+    )
 
 
-class MinisterOfPsychology(Minister):
+class MinisterOfPsychology(PatternMinister):
     """Considers human factors and emotional dimensions."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for emotional/psychological language
-        psychology_words = {"feel", "emotion", "fear", "trust", "motivation", "belief", "psychology", "mental"}
-        has_psychology_language = any(word in user_input.lower() for word in psychology_words)
-        
-        # Check for denial of emotions
-        denial_words = {"don't care", "no emotion", "purely logical", "irrelevant"}
-        is_denial = any(word in user_input.lower() for word in denial_words)
-        
-        if is_denial:
-            stance = "oppose"
-            confidence = 0.7
-            reasoning.append("Human factors being dismissed")
-        elif has_psychology_language:
-            stance = "support"
-            confidence = 0.7
-            reasoning.append("Psychological factors acknowledged")
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_psychology", {"stance": stance, "psychology_aware": has_psychology_language})
-        
-        return MinisterPosition(
-            domain="psychology",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Psychology neutral",
-        )
+    spec = MinisterSpec(
+        domain="psychology",
+        trace_event="minister_psychology",
+        positive=_Signal(_PSYCHOLOGY_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.7,
+        pos_reason="Psychological factors acknowledged",
+        negative=_Signal(_DENIAL_WORDS, _DENIAL_PHRASES),
+        neg_confidence=0.7,
+        neg_reason="Human factors being dismissed",
+        negative_first=True,
+        fallback_reasoning="Psychology neutral",
+        trace_extras=(("psychology_aware", "pos"),),
+    )
 
 
-class MinisterOfTechnology(Minister):
+class MinisterOfTechnology(PatternMinister):
     """Evaluates technical feasibility and capability."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for technical language
-        tech_words = {"system", "build", "code", "technical", "platform", "infrastructure", "api", "server"}
-        has_tech_language = any(word in user_input.lower() for word in tech_words)
-        
-        if has_tech_language:
-            stance = "support"
-            confidence = 0.6
-            reasoning.append("Technical approach considered")
-        else:
-            stance = "oppose"
-            confidence = 0.5
-            reasoning.append("Technical dimension overlooked")
-        
-        trace("minister_technology", {"stance": stance, "tech_aware": has_tech_language})
-        
-        return MinisterPosition(
-            domain="technology",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Technology neutral",
-        )
+    spec = MinisterSpec(
+        domain="technology",
+        trace_event="minister_technology",
+        positive=_Signal(_TECH_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.6,
+        pos_reason="Technical approach considered",
+        default_stance=OPPOSE,
+        default_confidence=0.5,
+        default_reason="Technical dimension overlooked",
+        fallback_reasoning="Technology neutral",
+        trace_extras=(("tech_aware", "pos"),),
+    )
 
 
 class MinisterOfLegitimacy(Minister):
     """Ensures actions align with values and authority."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        text = prepared.text
+        tokens = prepared.tokens
         reasoning = []
         doctrine_applied = False
         
         # Check doctrine prohibitions first (e.g., "must not make decisions without sovereign authority")
-        if self.doctrine and self.doctrine.prohibitions:
-            for prohibition in self.doctrine.prohibitions:
-                if prohibition.lower() in user_input.lower():
-                    reasoning.append(f"Doctrine violation: {prohibition}")
-                    doctrine_applied = True
-                    return MinisterPosition(
-                        domain="legitimacy",
-                        stance="oppose",
-                        confidence=0.95,
-                        reasoning=" | ".join(reasoning),
-                        red_line_triggered=True,
-                        doctrine_applied=True
-                    )
+        if self._prohib_re is not None:
+            m = self._prohib_re.search(text)
+            if m:
+                reasoning.append(f"Doctrine violation: {m.group(0)}")
+                return MinisterPosition(
+                    domain="legitimacy",
+                    stance=OPPOSE,
+                    confidence=0.95,
+                    reasoning=" | ".join(reasoning),
+                    red_line_triggered=True,
+                    doctrine_applied=True
+                )
         
         # Check for legitimacy/authority language
-        legit_words = {"authority", "right", "legal", "ethical", "values", "principle", "legitimate", "law"}
-        has_legit_language = any(word in user_input.lower() for word in legit_words)
+        has_legit_language = not _LEGIT_WORDS.isdisjoint(tokens)
         
         # Check for red flags
-        illegal_words = {"illegal", "unethical", "fraud", "corrupt", "steal", "cheat"}
-        has_red_flag = any(word in user_input.lower() for word in illegal_words)
+        has_red_flag = not _ILLEGAL_WORDS.isdisjoint(tokens)
         
         if has_red_flag:
-            stance = "oppose"
+            stance = OPPOSE
             confidence = 0.95
             reasoning.append("LEGITIMACY RED LINE")
             red_line = True
         elif has_legit_language:
-            stance = "support"
+            stance = SUPPORT
             confidence = 0.7
             reasoning.append("Values-aligned approach")
             red_line = False
         else:
-            stance = "neutral"
+            stance = NEUTRAL
             confidence = 0.5
             red_line = False
         
@@ -597,7 +871,9 @@ class MinisterOfLegitimacy(Minister):
 class MinisterOfTruth(Minister):
     """Prioritizes truth and accurate representation."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        text = prepared.text
+        tokens = prepared.tokens
         reasoning = []
         doctrine_applied = False
         
@@ -605,12 +881,12 @@ class MinisterOfTruth(Minister):
         if self.doctrine and self.doctrine.prohibitions:
             for prohibition in self.doctrine.prohibitions:
                 if "truth" in prohibition.lower() or "deception" in prohibition.lower():
-                    if any(word in user_input.lower() for word in ["lie", "deceive", "hide", "mislead", "fabricate"]):
+                    if any(word in prepared.phrases for word in _TRUTH_VIOLATION_MARKERS):
                         reasoning.append(f"Doctrine violation: {prohibition}")
                         doctrine_applied = True
                         return MinisterPosition(
                             domain="truth",
-                            stance="oppose",
+                            stance=OPPOSE,
                             confidence=0.9,
                             reasoning=" | ".join(reasoning),
                             red_line_triggered=True,
@@ -618,25 +894,23 @@ class MinisterOfTruth(Minister):
                         )
         
         # Check for truthfulness indicators
-        truth_words = {"true", "fact", "accurate", "verify", "proof", "evidence", "honest"}
-        has_truth_language = any(word in user_input.lower() for word in truth_words)
+        has_truth_language = not _TRUTH_WORDS.isdisjoint(tokens)
         
         # Check for deception signals
-        deception_words = {"lie", "hide", "mislead", "fabricate", "fiction", "false", "deceive"}
-        has_deception = any(word in user_input.lower() for word in deception_words)
+        has_deception = not _DECEPTION_WORDS.isdisjoint(tokens)
         
         if has_deception:
-            stance = "oppose"
+            stance = OPPOSE
             confidence = 0.9
             reasoning.append("Deception detected")
             red_line = True
         elif has_truth_language:
-            stance = "support"
+            stance = SUPPORT
             confidence = 0.8
             reasoning.append("Truth seeking evident")
             red_line = False
         else:
-            stance = "neutral"
+            stance = NEUTRAL
             confidence = 0.5
             red_line = False
         
@@ -656,32 +930,33 @@ class MinisterOfTruth(Minister):
 class MinisterOfNarrative(Minister):
     """Evaluates coherence and story alignment."""
     
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
+    def analyze_prepared(self, prepared: PreparedInput, context: Dict[str, Any]) -> MinisterPosition:
+        text = prepared.text
+        tokens = prepared.tokens
         reasoning = []
         
         # Check for narrative/story language
-        narrative_words = {"story", "narrative", "coherent", "consistent", "arc", "plot", "theme", "meaning"}
-        has_narrative_language = any(word in user_input.lower() for word in narrative_words)
+        has_narrative_language = not _NARRATIVE_WORDS.isdisjoint(tokens)
         
         # Check for contradictions
         recent_turns = context.get("recent_turns", [])
         narrative_consistent = True
         if recent_turns and len(recent_turns) > 2:
             # Simple heuristic: check if recent statements form coherent theme
-            recent_text = " ".join([turn[0] for turn in recent_turns[-3:]])
-            contradictions = recent_text.lower().count("but") + recent_text.lower().count("however")
+            recent_text = " ".join(prepared.recent_lower)
+            contradictions = len(_CONTRADICT_RE.findall(recent_text))
             narrative_consistent = contradictions < 3
         
         if not narrative_consistent:
-            stance = "oppose"
+            stance = OPPOSE
             confidence = 0.7
             reasoning.append("Narrative contradictions detected")
         elif has_narrative_language:
-            stance = "support"
+            stance = SUPPORT
             confidence = 0.7
             reasoning.append("Strong narrative coherence")
         else:
-            stance = "neutral"
+            stance = NEUTRAL
             confidence = 0.5
         
         trace("minister_narrative", {"stance": stance, "narrative_consistent": narrative_consistent})
@@ -694,185 +969,101 @@ class MinisterOfNarrative(Minister):
         )
 
 
-class MinisterOfSovereign(Minister):
+class MinisterOfSovereign(PatternMinister):
     """Meta-minister: evaluates overall coherence and authority."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for self-awareness and clarity
-        sovereign_words = {"I", "my", "decision", "I choose", "I will", "my authority"}
-        has_sovereign_language = any(word in user_input.lower() for word in sovereign_words)
-        
-        if has_sovereign_language:
-            stance = "support"
-            confidence = 0.8
-            reasoning.append("Self-directed action evident")
-        else:
-            stance = "oppose"
-            confidence = 0.6
-            reasoning.append("Clarity about agency needed")
-        
-        trace("minister_sovereign", {"stance": stance})
-        
-        return MinisterPosition(
-            domain="sovereign",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Sovereignty neutral",
-        )
+    spec = MinisterSpec(
+        domain="sovereign",
+        trace_event="minister_sovereign",
+        positive=_Signal(_SOVEREIGN_WORDS, _SOVEREIGN_PHRASES),
+        pos_stance=SUPPORT,
+        pos_confidence=0.8,
+        pos_reason="Self-directed action evident",
+        default_stance=OPPOSE,
+        default_confidence=0.6,
+        default_reason="Clarity about agency needed",
+        fallback_reasoning="Sovereignty neutral",
+    )
 
 
-class MinisterOfOptionality(Minister):
+class MinisterOfOptionality(PatternMinister):
     """Preserves freedom of action and strategic retreat options."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for commitment/lock-in signals
-        commitment_words = {"forever", "never go back", "all-in", "burn bridges", "irreversible"}
-        has_commitment_language = any(word in user_input.lower() for word in commitment_words)
-        
-        # Check for optionality appreciation
-        optionality_words = {"option", "exit", "flexibility", "retreat", "alternative", "backup"}
-        has_optionality_language = any(word in user_input.lower() for word in optionality_words)
-        
-        if has_commitment_language and not has_optionality_language:
-            stance = "oppose"
-            confidence = 0.8
-            reasoning.append("Excessive commitment detected; losing optionality")
-        elif has_optionality_language:
-            stance = "support"
-            confidence = 0.8
-            reasoning.append("Strategic optionality preserved")
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_optionality", {"stance": stance})
-        
-        return MinisterPosition(
-            domain="optionality",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Optionality neutral",
-            concerns=["irreversibility", "exit_collapse"] if stance == "oppose" else []
-        )
+    spec = MinisterSpec(
+        domain="optionality",
+        trace_event="minister_optionality",
+        positive=_Signal(_OPTIONALITY_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.8,
+        pos_reason="Strategic optionality preserved",
+        negative=_Signal(_COMMITMENT_WORDS, _COMMITMENT_PHRASES),
+        neg_confidence=0.8,
+        neg_reason="Excessive commitment detected; losing optionality",
+        negative_first=True,
+        neg_requires_no_pos=True,
+        fallback_reasoning="Optionality neutral",
+        concerns_on_oppose=("irreversibility", "exit_collapse"),
+    )
 
 
-class MinisterOfRiskResources(Minister):
+class MinisterOfRiskResources(PatternMinister):
     """Manages resource allocation under uncertainty and scarcity."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for resource awareness
-        resource_words = {"budget", "capital", "resources", "money", "time", "energy", "reserves"}
-        has_resource_language = any(word in user_input.lower() for word in resource_words)
-        
-        # Check for resource depletion signals
-        depletion_words = {"all", "everything", "out", "empty", "spent", "running out", "shortage"}
-        has_depletion = any(word in user_input.lower() for word in depletion_words)
-        
-        if has_depletion:
-            stance = "oppose"
-            confidence = 0.8
-            reasoning.append("Resource depletion risk detected")
-        elif has_resource_language:
-            stance = "support"
-            confidence = 0.7
-            reasoning.append("Resource constraints acknowledged")
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_risk_resources", {"stance": stance})
-        
-        return MinisterPosition(
-            domain="risk_resources",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Resource management neutral",
-            concerns=["scarcity", "depletion"] if has_depletion else []
-        )
+    spec = MinisterSpec(
+        domain="risk_resources",
+        trace_event="minister_risk_resources",
+        positive=_Signal(_RESOURCE_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.7,
+        pos_reason="Resource constraints acknowledged",
+        negative=_Signal(_DEPLETION_WORDS, _DEPLETION_PHRASES),
+        neg_confidence=0.8,
+        neg_reason="Resource depletion risk detected",
+        negative_first=True,
+        fallback_reasoning="Resource management neutral",
+        concerns_on_oppose=("scarcity", "depletion"),
+    )
 
 
-class MinisterOfTribunal(Minister):
+class MinisterOfTribunal(PatternMinister):
     """Represents accountability, judgment and consequences."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for accountability language
-        accountability_words = {"responsible", "accountable", "consequences", "liable", "fault", "blame"}
-        has_accountability = any(word in user_input.lower() for word in accountability_words)
-        
-        # Check for evasion signals
-        evasion_words = {"not my fault", "not responsible", "someone else", "blame others", "deny"}
-        has_evasion = any(word in user_input.lower() for word in evasion_words)
-        
-        if has_evasion:
-            stance = "oppose"
-            confidence = 0.8
-            reasoning.append("Accountability evasion detected")
-        elif has_accountability:
-            stance = "support"
-            confidence = 0.8
-            reasoning.append("Accountability acknowledged")
-        else:
-            stance = "neutral"
-            confidence = 0.5
-        
-        trace("minister_tribunal", {"stance": stance})
-        
-        return MinisterPosition(
-            domain="tribunal",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "Accountability neutral",
-            red_line_triggered=has_evasion and not has_accountability
-        )
+    spec = MinisterSpec(
+        domain="tribunal",
+        trace_event="minister_tribunal",
+        positive=_Signal(_ACCOUNTABILITY_WORDS),
+        pos_stance=SUPPORT,
+        pos_confidence=0.8,
+        pos_reason="Accountability acknowledged",
+        negative=_Signal(_EVASION_WORDS, _EVASION_PHRASES),
+        neg_confidence=0.8,
+        neg_reason="Accountability evasion detected",
+        negative_first=True,
+        fallback_reasoning="Accountability neutral",
+        red_line_rule="neg_not_pos",
+    )
 
 
-class MinisterOfWarMode(Minister):
+class MinisterOfWarMode(PatternMinister):
     """Evaluates scenarios requiring aggressive action and mobilization."""
-    
-    def analyze(self, user_input: str, context: Dict[str, Any]) -> MinisterPosition:
-        reasoning = []
-        
-        # Check for conflict/war language
-        war_words = {"attack", "defend attack", "mobilize", "aggressive", "enemy", "battle", "survival"}
-        has_war_language = any(word in user_input.lower() for word in war_words)
-        
-        # Check for escalation
-        escalation_words = {"escalat", "intensify", "full force", "all hands", "total war"}
-        has_escalation = any(word in user_input.lower() for word in escalation_words)
-        
-        if has_escalation:
-            stance = "support"
-            confidence = 0.85
-            reasoning.append("Escalation scenario active; mobilization required")
-        elif has_war_language:
-            stance = "support"
-            confidence = 0.7
-            reasoning.append("Conflict requires aggressive posture")
-        else:
-            stance = "oppose"  # War minister advocates for peace when not under threat
-            confidence = 0.6
-            reasoning.append("No immediate threat; prefer diplomatic approaches")
-        
-        trace("minister_war_mode", {"stance": stance, "escalation": has_escalation})
-        
-        return MinisterPosition(
-            domain="war_mode",
-            stance=stance,
-            confidence=confidence,
-            reasoning=" | ".join(reasoning) if reasoning else "War mode neutral",
-        )
+    spec = MinisterSpec(
+        domain="war_mode",
+        trace_event="minister_war_mode",
+        positive=_Signal(_WAR_WORDS, _WAR_PHRASES),
+        pos_stance=SUPPORT,
+        pos_confidence=0.7,
+        pos_reason="Conflict requires aggressive posture",
+        negative=_Signal(phrases=_ESCALATION_PHRASES),
+        neg_stance=SUPPORT,
+        neg_confidence=0.85,
+        neg_reason="Escalation scenario active; mobilization required",
+        negative_first=True,
+        default_stance=OPPOSE,  # War minister advocates for peace when not under threat
+        default_confidence=0.6,
+        default_reason="No immediate threat; prefer diplomatic approaches",
+        fallback_reasoning="War mode neutral",
+        trace_extras=(("escalation", "neg"),),
+    )
 
 
-# 19 voting ministers (core council)
-MINISTERS = {
+# 19 voting minister classes (core council)
+MINISTER_CLASSES = {
     "adaptation": MinisterOfAdaptation,
     "conflict": MinisterOfConflict,
     "diplomacy": MinisterOfDiplomacy,
@@ -895,6 +1086,17 @@ MINISTERS = {
 }
 
 # Judges: advisory roles that observe but don't vote
-JUDGES = {
+JUDGE_CLASSES = {
     "tribunal": MinisterOfTribunal,
 }
+
+# Shared singleton instances, built once at import. Ministers keep no
+# per-turn state (everything per-dispatch travels in PreparedInput and
+# context), so every council reuses these instead of re-running 20
+# doctrine-loading __init__s per aggregator.
+MINISTERS: Dict[str, Minister] = {
+    name: cls(domain=name) for name, cls in MINISTER_CLASSES.items()
+}
+JUDGES: Dict[str, Minister] = {
+    name: cls(domain=name) for name, cls in JUDGE_CLASSES.items()
+}
@@ -12,10 +12,10 @@ from .mode_orchestrator import (
     ModeOrchestrator,
     ModeResponse,
     ModeStrategy,
-    QuickModeStrategy,
-    WarModeStrategy,
-    MeetingModeStrategy,
-    DarbarModeStrategy,
+    QUICK_STRATEGY,
+    WAR_STRATEGY,
+    MEETING_STRATEGY,
+    DARBAR_STRATEGY,
 )
 
 from .mode_metrics import ModeMetrics
@@ -24,9 +24,9 @@ __all__ = [
     "ModeOrchestrator",
     "ModeResponse",
     "ModeStrategy",
-    "QuickModeStrategy",
-    "WarModeStrategy",
-    "MeetingModeStrategy",
-    "DarbarModeStrategy",
+    "QUICK_STRATEGY",
+    "WAR_STRATEGY",
+    "MEETING_STRATEGY",
+    "DARBAR_STRATEGY",
     "ModeMetrics",
 ]
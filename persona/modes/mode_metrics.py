@@ -20,8 +20,21 @@ Usage:
     comparison = metrics.compare_modes()
 """
 
+from bisect import insort
 from typing import Dict, List
-from collections import defaultdict
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class _ModeStats:
+    """Per-mode counters. A slots instance instead of a 6-key dict: attribute
+    access is C-level and each mode costs ~80 bytes rather than dict overhead."""
+    turns: int = 0
+    successes: int = 0
+    failures: int = 0
+    sum_confidence: float = 0.0
+    sum_regret: float = 0.0
+    total_decisions: int = 0
 
 
 class ModeMetrics:
@@ -34,15 +47,35 @@ class ModeMetrics:
     
     def __init__(self):
         """Initialize empty metrics storage."""
-        self.by_mode = defaultdict(lambda: {
-            "turns": 0,
-            "successes": 0,
-            "failures": 0,
-            "avg_confidence": 0.0,
-            "avg_regret": 0.0,
-            "total_decisions": 0,
-        })
-    
+        self.by_mode: Dict[str, _ModeStats] = {}
+        # Mode names kept sorted by success rate (best first) and updated
+        # incrementally on record, so best/worst lookups don't re-sort
+        self._order: List[str] = []
+        # Monotonic data version; lets compare_modes() reuse its last snapshot
+        # when nothing was recorded since it was built
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot: List[Dict[str, float]] = []
+
+    def _get(self, mode: str) -> _ModeStats:
+        """Stats for a mode, lazily inserted on first touch."""
+        stats = self.by_mode.get(mode)
+        if stats is None:
+            stats = self.by_mode[mode] = _ModeStats()
+            insort(self._order, mode, key=self._neg_rate)
+        return stats
+
+    def _neg_rate(self, mode: str) -> float:
+        """Sort key: negated success rate, so the order list runs best-first."""
+        stats = self.by_mode[mode]
+        total = stats.successes + stats.failures
+        return -(stats.successes / total) if total else 0.0
+
+    def _reorder(self, mode: str) -> None:
+        """Re-seat one mode in the rate-sorted order after its stats changed."""
+        self._order.remove(mode)
+        insort(self._order, mode, key=self._neg_rate)
+
     def record_mode_decision(
         self,
         mode: str,
@@ -59,30 +92,27 @@ class ModeMetrics:
             confidence: Confidence level (0.0-1.0)
             regret: Regret score (0.0-1.0, higher = more regrettable)
         """
-        stats = self.by_mode[mode]
-        stats["turns"] += 1
-        stats["total_decisions"] += 1
+        stats = self._get(mode)
+        stats.turns += 1
+        stats.total_decisions += 1
+        self._version += 1
         
-        # Track outcomes
+        # Track outcomes. Only scored outcomes contribute to the sums;
+        # "neutral" decisions count as turns but not toward the averages,
+        # which the old incremental-average update got wrong (a neutral
+        # decision overwrote a prior sample's weight instead of being
+        # excluded). Sums also divide once on read instead of redoing the
+        # (avg*(n-1)+x)/n dance per record, so results no longer pick up
+        # rounding error that grows with the number of decisions.
         if outcome == "success":
-            stats["successes"] += 1
+            stats.successes += 1
         elif outcome == "failure":
-            stats["failures"] += 1
-        
-        # Update running averages
-        total = stats["successes"] + stats["failures"]
-        if total > 0:
-            # Recalculate average confidence
-            old_avg = stats["avg_confidence"]
-            stats["avg_confidence"] = (
-                (old_avg * (total - 1) + confidence) / total
-            )
-            
-            # Recalculate average regret
-            old_regret = stats["avg_regret"]
-            stats["avg_regret"] = (
-                (old_regret * (total - 1) + regret) / total
-            )
+            stats.failures += 1
+        else:
+            return
+        stats.sum_confidence += confidence
+        stats.sum_regret += regret
+        self._reorder(mode)
     
     def get_mode_performance(self, mode: str) -> Dict[str, float]:
         """
@@ -100,8 +130,8 @@ class ModeMetrics:
                 - avg_confidence: Average confidence across decisions
                 - avg_regret: Average regret across decisions
         """
-        stats = self.by_mode[mode]
-        total = stats["successes"] + stats["failures"]
+        stats = self._get(mode)
+        total = stats.successes + stats.failures
         
         if total == 0:
             return {
@@ -115,12 +145,12 @@ class ModeMetrics:
         
         return {
             "mode": mode,
-            "turns": stats["turns"],
+            "turns": stats.turns,
             "total_decisions": total,
-            "success_rate": stats["successes"] / total,
-            "failure_rate": stats["failures"] / total,
-            "avg_confidence": stats["avg_confidence"],
-            "avg_regret": stats["avg_regret"],
+            "success_rate": stats.successes / total,
+            "failure_rate": stats.failures / total,
+            "avg_confidence": stats.sum_confidence / total,
+            "avg_regret": stats.sum_regret / total,
         }
     
     def compare_modes(self) -> List[Dict[str, float]]:
@@ -129,10 +159,17 @@ class ModeMetrics:
         
         Returns:
             List of performance dicts for all modes, sorted by success rate (descending)
+
+        The result is cached against the data version: repeated calls with no
+        intervening record_mode_decision() return the prior snapshot instead
+        of recomputing and re-sorting.
         """
-        results = [self.get_mode_performance(mode) for mode in self.by_mode.keys()]
-        # Sort by success rate (descending)
-        return sorted(results, key=lambda x: x.get("success_rate", 0.0), reverse=True)
+        if self._version == self._snapshot_version:
+            return self._snapshot
+        # self._order is already success-rate-sorted (best first)
+        self._snapshot = [self.get_mode_performance(mode) for mode in list(self._order)]
+        self._snapshot_version = self._version
+        return self._snapshot
     
     def get_best_mode(self) -> Dict[str, float]:
         """
@@ -141,8 +178,9 @@ class ModeMetrics:
         Returns:
             Performance dict for the best-performing mode
         """
-        comparison = self.compare_modes()
-        return comparison[0] if comparison else {}
+        if not self._order:
+            return {}
+        return self.get_mode_performance(self._order[0])
     
     def get_worst_mode(self) -> Dict[str, float]:
         """
@@ -151,8 +189,9 @@ class ModeMetrics:
         Returns:
             Performance dict for the worst-performing mode
         """
-        comparison = self.compare_modes()
-        return comparison[-1] if comparison else {}
+        if not self._order:
+            return {}
+        return self.get_mode_performance(self._order[-1])
     
     def get_mode_summary(self) -> Dict[str, Dict]:
         """
@@ -170,18 +209,18 @@ class ModeMetrics:
         Args:
             mode: Mode to reset
         """
-        self.by_mode[mode] = {
-            "turns": 0,
-            "successes": 0,
-            "failures": 0,
-            "avg_confidence": 0.0,
-            "avg_regret": 0.0,
-            "total_decisions": 0,
-        }
-    
+        if mode in self.by_mode:
+            self.by_mode[mode] = _ModeStats()
+            self._reorder(mode)
+        else:
+            self._get(mode)
+        self._version += 1
+
     def reset_all(self) -> None:
         """Reset all metrics."""
         self.by_mode.clear()
+        self._order.clear()
+        self._version += 1
     
     def get_all_modes(self) -> List[str]:
         """Get list of all modes with recorded data."""
@@ -189,4 +228,4 @@ class ModeMetrics:
     
     def has_data_for_mode(self, mode: str) -> bool:
         """Check if metrics exist for a mode."""
-        return mode in self.by_mode and self.by_mode[mode]["total_decisions"] > 0
+        return mode in self.by_mode and self.by_mode[mode].total_decisions > 0
@@ -10,14 +10,58 @@ Different modes invoke different reasoning pathways:
 This is the critical control layer that changes the entire decision pipeline.
 """
 
-from typing import Dict, Any, List, Optional
-from abc import ABC, abstractmethod
+from typing import Dict, Any, Callable, List, Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+from ..ministers import MINISTERS, SUPPORT, OPPOSE
 
-@dataclass
+# Full voting roster for DARBAR mode, derived from the registry so the two
+# can't drift apart (the old hardcoded list said "resources" instead of
+# "risk_resources" and was missing several ministers)
+_ALL_MINISTER_NAMES = tuple(MINISTERS.keys())
+
+
+# Map domains to relevant ministers (meeting mode). Module-level so the
+# selection helper below can be cached against it.
+_DOMAIN_MINISTER_MAP = {
+    "career": ("grand_strategist", "psychology", "timing"),
+    "financial": ("risk", "optionality", "data"),
+    "relationships": ("diplomacy", "psychology", "legitimacy"),
+    "health": ("psychology", "timing", "risk"),
+    "strategy": ("grand_strategist", "intelligence", "timing"),
+    "power": ("power", "diplomacy", "conflict"),
+    "ethics": ("legitimacy", "truth", "discipline"),
+    "innovation": ("technology", "grand_strategist", "risk"),
+}
+
+
+@lru_cache(maxsize=256)
+def _ministers_for_domains(domains: frozenset) -> tuple:
+    """
+    Meeting-mode minister selection for a set of detected domains.
+
+    The domain map is static, and the same domain set is mapped at least
+    twice per turn (minister selection plus prompt framing), so the result
+    is memoized on the frozen domain set.
+    """
+    ministers = set()
+    for domain in domains:
+        mapped = _DOMAIN_MINISTER_MAP.get(domain)
+        if mapped:
+            ministers.update(mapped[:2])  # Take top 2 per domain
+
+    # Always include risk as sanity check
+    ministers.add("risk")
+
+    # Cap at 5 ministers
+    return tuple(ministers)[:5]
+
+
+@dataclass(slots=True)
 class ModeResponse:
-    """Response with mode metadata."""
+    """Response with mode metadata. Slots: one is built per turn and only
+    the declared fields are ever set, so skip the per-instance __dict__."""
     text: str
     mode: str
     ministers_involved: List[str] = field(default_factory=list)
@@ -26,50 +70,11 @@ class ModeResponse:
     feature_flags: Dict[str, bool] = field(default_factory=dict)
 
 
-class ModeStrategy(ABC):
-    """Abstract base for mode-specific behavior."""
-    
-    @abstractmethod
-    def decide_ministers_to_invoke(self, context: Dict[str, Any]) -> List[str]:
-        """Which ministers should be involved?"""
-        pass
-    
-    @abstractmethod
-    def aggregate_minister_inputs(self, positions: Dict[str, Any]) -> Dict[str, Any]:
-        """How to combine minister positions?"""
-        pass
-    
-    @abstractmethod
-    def frame_decision(self, user_input: str, context: Dict[str, Any]) -> str:
-        """How to frame the decision problem?"""
-        pass
-    
-    @abstractmethod
-    def should_invoke_council(self) -> bool:
-        """Should we run ministerial council?"""
-        pass
+# Mode framing prompts, built once at import instead of re-concatenated
+# as f-strings on every turn; frame_decision just fills {user_input}
+# (and {ministers} for meeting mode).
 
-
-class QuickModeStrategy(ModeStrategy):
-    """
-    QUICK MODE: 1:1 Conversation
-    
-    - Direct LLM response
-    - NO ministerial council
-    - Intuitive, personal, fast
-    - Suitable for: initial exploration, casual advice, emotional support
-    """
-    
-    def decide_ministers_to_invoke(self, context: Dict[str, Any]) -> List[str]:
-        """No ministers in quick mode."""
-        return []
-    
-    def should_invoke_council(self) -> bool:
-        return False
-    
-    def frame_decision(self, user_input: str, context: Dict[str, Any]) -> str:
-        """Frame as personal conversation, not analytical."""
-        return f"""
+_QUICK_FRAME = """
 You are in QUICK MODE - a 1:1 mentor conversation.
 
 Characteristics:
@@ -84,40 +89,9 @@ User concern:
 
 Respond naturally, warmly, with genuine interest.
 """
-    
-    def aggregate_minister_inputs(self, positions: Dict[str, Any]) -> Dict[str, Any]:
-        """No aggregation needed in quick mode."""
-        return {}
 
 
-class WarModeStrategy(ModeStrategy):
-    """
-    WAR MODE: Victory-Focused Decision Making
-    
-    - Frame: "How do we WIN?"
-    - Ministers: Risk, Power, Strategy, Technology, Timing
-    - Optimize for: Victory, speed, competitive advantage
-    - May sacrifice: Ethics (NO), long-term gain for short-term wins
-    - Use case: Competitive situations, defensive crises, aggressive goals
-    - Red lines: NEVER ignore existential risks or irreversible damage
-    """
-    
-    def decide_ministers_to_invoke(self, context: Dict[str, Any]) -> List[str]:
-        """Only invoke ministers focused on winning."""
-        return [
-            "risk",               # Downside protection
-            "power",              # Leverage & advantage
-            "grand_strategist",   # Strategic wins
-            "technology",         # Tactical advantage
-            "timing",             # Strike when ready
-        ]
-    
-    def should_invoke_council(self) -> bool:
-        return True
-    
-    def frame_decision(self, user_input: str, context: Dict[str, Any]) -> str:
-        """Frame as: How do we WIN?"""
-        return f"""
+_WAR_FRAME = """
 You are in WAR MODE - optimizing for VICTORY.
 
 Strategic Frame: "How do we WIN this?"
@@ -146,66 +120,9 @@ User situation:
 Facilitate war council debate. Recommend the aggressive-but-smart winning strategy.
 Ensure Risk minister's existential concerns are heard.
 """
-    
-    def aggregate_minister_inputs(self, positions: Dict[str, Any]) -> Dict[str, Any]:
-        """In war mode: Support aggressive stances, but heed red lines."""
-        war_aligned = sum(1 for p in positions.values() if p.get("stance") == "support")
-        total = len(positions)
-        red_lines = [m for m, p in positions.items() if p.get("red_line_triggered")]
-        
-        return {
-            "war_alignment": war_aligned / total if total > 0 else 0,
-            "recommendation_type": "aggressive_if_war_aligned_else_cautious",
-            "red_line_concerns": red_lines,
-            "ethical_override_allowed": False,  # NEVER override ethics
-        }
 
 
-class MeetingModeStrategy(ModeStrategy):
-    """
-    MEETING MODE: Structured Debate
-    
-    - Structure: Invoke 3-5 relevant ministers, each presents perspective
-    - Synthesis: Combine into balanced view
-    - Suitable for: Complex decisions, multi-stakeholder issues
-    - Goal: Create consensus among diverse viewpoints
-    """
-    
-    def decide_ministers_to_invoke(self, context: Dict[str, Any]) -> List[str]:
-        """Select 3-5 ministers relevant to detected domains."""
-        domains = context.get("domains", [])
-        
-        # Map domains to relevant ministers
-        domain_minister_map = {
-            "career": ["grand_strategist", "psychology", "timing"],
-            "financial": ["risk", "optionality", "data"],
-            "relationships": ["diplomacy", "psychology", "legitimacy"],
-            "health": ["psychology", "timing", "risk"],
-            "strategy": ["grand_strategist", "intelligence", "timing"],
-            "power": ["power", "diplomacy", "conflict"],
-            "ethics": ["legitimacy", "truth", "discipline"],
-            "innovation": ["technology", "grand_strategist", "risk"],
-        }
-        
-        # Gather ministers based on detected domains
-        ministers = set()
-        for domain in domains:
-            if domain in domain_minister_map:
-                ministers.update(domain_minister_map[domain][:2])  # Take top 2 per domain
-        
-        # Always include risk as sanity check
-        ministers.add("risk")
-        
-        # Cap at 5 ministers
-        return list(ministers)[:5]
-    
-    def should_invoke_council(self) -> bool:
-        return True
-    
-    def frame_decision(self, user_input: str, context: Dict[str, Any]) -> str:
-        """Frame as structured debate."""
-        ministers = self.decide_ministers_to_invoke(context)
-        return f"""
+_MEETING_FRAME = """
 You are in MEETING MODE - structured debate and consensus building.
 
 Structure:
@@ -215,7 +132,7 @@ Structure:
 4. Synthesize into balanced recommendation
 
 Ministers present:
-{', '.join(ministers)}
+{ministers}
 
 Decision format:
 - Where do they agree strongly?
@@ -228,58 +145,15 @@ User situation:
 
 Guide a thoughtful, structured debate. Show reasoning. Synthesize clearly.
 """
-    
-    def aggregate_minister_inputs(self, positions: Dict[str, Any]) -> Dict[str, Any]:
-        """Consensus-seeking aggregation."""
-        stances = [p.get("stance") for p in positions.values()]
-        support_count = sum(1 for s in stances if s == "support")
-        oppose_count = sum(1 for s in stances if s == "oppose")
-        total = len(stances)
-        
-        # High consensus if 60%+ align
-        consensus_quality = "high" if abs(support_count - oppose_count) >= total * 0.6 else "mixed"
-        
-        return {
-            "consensus_quality": consensus_quality,
-            "support_ratio": support_count / total if total > 0 else 0,
-            "recommendation_type": "balanced",
-            "should_note_disagreement": oppose_count > 0,
-            "disagreement_count": oppose_count,
-        }
 
 
-class DarbarModeStrategy(ModeStrategy):
-    """
-    DARBAR MODE: Full Council, Deep Wisdom
-    
-    - Invoke: ALL 19 voting ministers + judges
-    - Structure: Full doctrine-driven council deliberation
-    - Synthesis: Complete reasoning, consensus building
-    - Red lines: Legitimacy, Truth, Fundamental harm
-    - Suitable for: High-stakes decisions, existential questions, final arbitration
-    """
-    
-    def decide_ministers_to_invoke(self, context: Dict[str, Any]) -> List[str]:
-        """Invoke ALL ministers for full council."""
-        return [
-            "adaptation", "conflict", "diplomacy", "data", "discipline",
-            "grand_strategist", "intelligence", "timing", "risk", "power",
-            "psychology", "technology", "legitimacy", "truth", "narrative",
-            "resources", "optionality", "sovereign",
-        ]
-    
-    def should_invoke_council(self) -> bool:
-        return True
-    
-    def frame_decision(self, user_input: str, context: Dict[str, Any]) -> str:
-        """Frame as deep council deliberation."""
-        return f"""
+_DARBAR_FRAME = """
 You are DARBAR MODE - Full Council Deliberation.
 
 This is a high-stakes decision requiring deep, multi-perspective wisdom.
 
 Process:
-1. Each of 18 ministers states their position (doctrine-driven)
+1. Each of {n_ministers} ministers states their position (doctrine-driven)
 2. Identify strong consensus and deep disagreement
 3. Surface any doctrine red lines
 4. Synthesize into comprehensive wisdom
@@ -290,10 +164,7 @@ RED LINES (blocks any recommendation):
 - Fundamental harm (death, irreversible damage, existential risk)
 
 Ministers participating:
-Adaptation, Conflict, Diplomacy, Data, Discipline,
-Grand Strategist, Intelligence, Timing, Risk, Power,
-Psychology, Technology, Legitimacy, Truth, Narrative,
-Resources, Optionality, Sovereign
+{roster}
 
 User situation:
 {user_input}
@@ -304,38 +175,214 @@ Note disagreements and their sources.
 Synthesize into final wisdom that respects doctrine constraints.
 If red lines are triggered, state them clearly and explain why recommendation is blocked.
 """
-    
-    def aggregate_minister_inputs(self, positions: Dict[str, Any]) -> Dict[str, Any]:
-        """Full consensus-seeking with doctrine respect."""
-        red_lines = [m for m, p in positions.items() if p.get("red_line_triggered")]
-        support = sum(1 for p in positions.values() if p.get("stance") == "support")
-        total = len(positions)
-        
-        return {
-            "red_line_concerns": red_lines,
-            "consensus_strength": support / total if total > 0 else 0,
-            "recommendation_type": "doctrine_compliant_consensus",
-            "requires_prime_confident_review": len(red_lines) > 0,
-            "total_ministers": total,
-        }
+
+# The darbar roster is static, so bake the count and display names in once;
+# only {user_input} remains to fill per turn
+_DARBAR_FRAME = _DARBAR_FRAME.replace(
+    "{n_ministers}", str(len(_ALL_MINISTER_NAMES))
+).replace(
+    "{roster}", ", ".join(name.replace("_", " ").title() for name in _ALL_MINISTER_NAMES)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ModeStrategy:
+    """
+    One conversation mode's behavior as data: which ministers to convene,
+    how to frame the prompt, how to aggregate positions, and whether the
+    council runs at all. The four modes are plain function pointers on a
+    frozen struct (instantiated once below) rather than a class hierarchy,
+    so strategy dispatch is a slot read instead of a method lookup.
+    """
+    decide: Callable[[Dict[str, Any]], List[str]]
+    frame: Callable[[str, Dict[str, Any]], str]
+    aggregate: Callable[[Dict[str, Any]], Dict[str, Any]]
+    invoke_council: bool
+
+
+def _quick_decide(context: Dict[str, Any]) -> List[str]:
+    """No ministers in quick mode."""
+    return []
+
+
+def _quick_frame(user_input: str, context: Dict[str, Any]) -> str:
+    """Frame as personal conversation, not analytical."""
+    return _QUICK_FRAME.format(user_input=user_input)
+
+
+def _quick_aggregate(positions: Dict[str, Any]) -> Dict[str, Any]:
+    """No aggregation needed in quick mode."""
+    return {}
+
+
+_WAR_MINISTERS = (
+    "risk",               # Downside protection
+    "power",              # Leverage & advantage
+    "grand_strategist",   # Strategic wins
+    "technology",         # Tactical advantage
+    "timing",             # Strike when ready
+)
+
+
+def _war_decide(context: Dict[str, Any]) -> List[str]:
+    """Only invoke ministers focused on winning."""
+    return list(_WAR_MINISTERS)
+
+
+def _war_frame(user_input: str, context: Dict[str, Any]) -> str:
+    """Frame as: How do we WIN?"""
+    return _WAR_FRAME.format(user_input=user_input)
+
+
+def _war_aggregate(positions: Dict[str, Any]) -> Dict[str, Any]:
+    """In war mode: Support aggressive stances, but heed red lines."""
+    # One pass over positions instead of separate support and red-line scans
+    war_aligned = 0
+    red_lines = []
+    for m, p in positions.items():
+        if p.get("stance") == SUPPORT:
+            war_aligned += 1
+        if p.get("red_line_triggered"):
+            red_lines.append(m)
+    total = len(positions)
+
+    return {
+        "war_alignment": war_aligned / total if total > 0 else 0,
+        "recommendation_type": "aggressive_if_war_aligned_else_cautious",
+        "red_line_concerns": red_lines,
+        "ethical_override_allowed": False,  # NEVER override ethics
+    }
+
+
+def _meeting_decide(context: Dict[str, Any]) -> List[str]:
+    """Select 3-5 ministers relevant to detected domains."""
+    return list(_ministers_for_domains(frozenset(context.get("domains", []))))
+
+
+def _meeting_frame(user_input: str, context: Dict[str, Any]) -> str:
+    """Frame as structured debate."""
+    ministers = _ministers_for_domains(frozenset(context.get("domains", [])))
+    return _MEETING_FRAME.format(ministers=", ".join(ministers), user_input=user_input)
+
+
+def _meeting_aggregate(positions: Dict[str, Any]) -> Dict[str, Any]:
+    """Consensus-seeking aggregation."""
+    # One pass over positions instead of a stance list plus two sums
+    support_count = 0
+    oppose_count = 0
+    for p in positions.values():
+        stance = p.get("stance")
+        if stance == SUPPORT:
+            support_count += 1
+        elif stance == OPPOSE:
+            oppose_count += 1
+    total = len(positions)
+
+    # High consensus if 60%+ align
+    consensus_quality = "high" if abs(support_count - oppose_count) >= total * 0.6 else "mixed"
+
+    return {
+        "consensus_quality": consensus_quality,
+        "support_ratio": support_count / total if total > 0 else 0,
+        "recommendation_type": "balanced",
+        "should_note_disagreement": oppose_count > 0,
+        "disagreement_count": oppose_count,
+    }
+
+
+def _darbar_decide(context: Dict[str, Any]) -> List[str]:
+    """Invoke ALL ministers for full council."""
+    return list(_ALL_MINISTER_NAMES)
+
+
+def _darbar_frame(user_input: str, context: Dict[str, Any]) -> str:
+    """Frame as deep council deliberation."""
+    return _DARBAR_FRAME.format(user_input=user_input)
+
+
+def _darbar_aggregate(positions: Dict[str, Any]) -> Dict[str, Any]:
+    """Full consensus-seeking with doctrine respect."""
+    # One pass over positions instead of separate red-line and support scans
+    red_lines = []
+    support = 0
+    for m, p in positions.items():
+        if p.get("red_line_triggered"):
+            red_lines.append(m)
+        if p.get("stance") == SUPPORT:
+            support += 1
+    total = len(positions)
+
+    return {
+        "red_line_concerns": red_lines,
+        "consensus_strength": support / total if total > 0 else 0,
+        "recommendation_type": "doctrine_compliant_consensus",
+        "requires_prime_confident_review": len(red_lines) > 0,
+        "total_ministers": total,
+    }
+
+
+# QUICK MODE: 1:1 conversation - direct LLM response, no council.
+# Intuitive, personal, fast; suits exploration, casual advice, support.
+QUICK_STRATEGY = ModeStrategy(
+    decide=_quick_decide,
+    frame=_quick_frame,
+    aggregate=_quick_aggregate,
+    invoke_council=False,
+)
+
+# WAR MODE: victory-focused - Risk/Power/Strategy/Technology/Timing only.
+# Optimizes for winning; red lines on existential or irreversible damage.
+WAR_STRATEGY = ModeStrategy(
+    decide=_war_decide,
+    frame=_war_frame,
+    aggregate=_war_aggregate,
+    invoke_council=True,
+)
+
+# MEETING MODE: structured debate - 3-5 domain-relevant ministers,
+# consensus-seeking synthesis of diverse viewpoints.
+MEETING_STRATEGY = ModeStrategy(
+    decide=_meeting_decide,
+    frame=_meeting_frame,
+    aggregate=_meeting_aggregate,
+    invoke_council=True,
+)
+
+# DARBAR MODE: full council - every voting minister, doctrine-driven
+# deliberation for high-stakes or existential decisions.
+DARBAR_STRATEGY = ModeStrategy(
+    decide=_darbar_decide,
+    frame=_darbar_frame,
+    aggregate=_darbar_aggregate,
+    invoke_council=True,
+)
+
+# Strategies are stateless constants shared by every orchestrator
+_STRATEGIES: Dict[str, ModeStrategy] = {
+    "quick": QUICK_STRATEGY,
+    "war": WAR_STRATEGY,
+    "meeting": MEETING_STRATEGY,
+    "darbar": DARBAR_STRATEGY,
+}
 
 
 class ModeOrchestrator:
     """
     Central orchestrator for mode-specific decision making.
-    
+
     Routes the entire decision pipeline based on current mode.
     This is the critical control layer that shapes how Persona reasons.
+
+    Note on input preparation: lowering/tokenizing/keyword-scanning the user
+    input is deliberately NOT done here. persona.ministers.prepare() builds
+    one shared PreparedInput per dispatch, and both CouncilAggregator.convene
+    and DynamicCouncil._convene_mode_council hand that single view to every
+    minister, so the orchestrator stays a pure routing layer.
     """
     
     def __init__(self):
-        """Initialize all mode strategies."""
-        self.strategies: Dict[str, ModeStrategy] = {
-            "quick": QuickModeStrategy(),
-            "war": WarModeStrategy(),
-            "meeting": MeetingModeStrategy(),
-            "darbar": DarbarModeStrategy(),
-        }
+        """Initialize with the shared mode strategies."""
+        self.strategies: Dict[str, ModeStrategy] = dict(_STRATEGIES)
         
         # Default mode
         self.current_mode = "meeting"
@@ -359,7 +406,7 @@ class ModeOrchestrator:
     def should_invoke_council(self, mode: Optional[str] = None) -> bool:
         """Does this mode use ministerial council?"""
         strategy = self.get_strategy(mode)
-        return strategy.should_invoke_council()
+        return strategy.invoke_council
     
     def get_ministers_for_mode(
         self,
@@ -369,7 +416,7 @@ class ModeOrchestrator:
         """Which ministers to invoke for this mode?"""
         context = context or {}
         strategy = self.get_strategy(mode)
-        return strategy.decide_ministers_to_invoke(context)
+        return strategy.decide(context)
     
     def frame_for_mode(
         self,
@@ -380,7 +427,7 @@ class ModeOrchestrator:
         """Get mode-specific framing prompt."""
         context = context or {}
         strategy = self.get_strategy(mode)
-        return strategy.frame_decision(user_input, context)
+        return strategy.frame(user_input, context)
     
     def aggregate_for_mode(
         self,
@@ -389,7 +436,7 @@ class ModeOrchestrator:
     ) -> Dict[str, Any]:
         """Aggregate minister positions according to mode rules."""
         strategy = self.get_strategy(mode)
-        return strategy.aggregate_minister_inputs(positions)
+        return strategy.aggregate(positions)
     
     def list_modes(self) -> List[str]:
         """List all available modes."""
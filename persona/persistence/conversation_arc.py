@@ -1,28 +1,96 @@
 # conversation_arc.py
 
+import re
 from collections import defaultdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+def _iso_now():
+    # One timestamp per turn: callers that fire several arc events in the
+    # same turn pass this value through instead of re-formatting datetime
+    # per event. utcnow() is deprecated; the tz-aware form is also faster.
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass(slots=True)
+class Decision:
+    turn: int
+    domain: str
+    decision: str
+    confidence: float
+
+
+@dataclass(slots=True)
+class Consequence:
+    origin_turn: int
+    current_turn: int
+    domain: str
+    magnitude: float
+
+
+@dataclass(slots=True)
+class Crisis:
+    turn_injected: int
+    domain: str
+    severity: float
+    resolved: bool = False
 
 
 class ConversationArc:
 
+    # Slotted records above replace the old per-event dicts: roughly a
+    # third of the memory per record and faster attribute reads during
+    # scans. original_problem stays a dict because callers subscript it.
+    __slots__ = (
+        "original_problem",
+        "original_domain",
+        "decisions_made",
+        "_decisions_by_domain",
+        "consequences",
+        "crisis_history",
+        "_open_crises_by_domain",
+        "_unresolved_crises",
+        "unresolved_issues",
+        "_loop_domains",
+        "resolution_status",
+    )
+
+    # Compiled once; a single alternation scan per decision string replaces
+    # the old per-pair substring loop
+    _NEG_RE = re.compile(r"reduce|cut|stop|avoid")
+    _POS_RE = re.compile(r"increase|expand|invest|accelerate")
+
     def __init__(self):
 
         self.original_problem = None
         self.original_domain = None
 
         self.decisions_made = []
-        # [{turn, domain, decision, confidence}]
+        # [Decision(turn, domain, decision, confidence)]
+
+        self._decisions_by_domain = defaultdict(list)
+        # domain -> entries of decisions_made, so contradiction checks only
+        # walk decisions from the domain in question
 
         self.consequences = []
-        # [{origin_turn, current_turn, domain, magnitude}]
+        # [Consequence(origin_turn, current_turn, domain, magnitude)]
 
         self.crisis_history = []
-        # [{turn_injected, domain, severity, resolved}]
+        # [Crisis(turn_injected, domain, severity, resolved)]
+
+        self._open_crises_by_domain = defaultdict(list)
+        # domain -> unresolved Crisis records (shared with crisis_history)
+
+        self._unresolved_crises = 0
 
         self.unresolved_issues = defaultdict(int)
         # domain -> recurrence count
 
+        self._loop_domains = set()
+        # domains at/over the default loop threshold, maintained at
+        # increment time so the common detect call is a lookup, not a scan
+
         self.resolution_status = "open"
         # open | resolved | escalated
 
@@ -30,13 +98,13 @@ class ConversationArc:
     # ORIGINAL PROBLEM TRACKING
     # ---------------------------------------------------------
 
-    def set_original_problem(self, turn, domain, description):
+    def set_original_problem(self, turn, domain, description, timestamp=None):
         if self.original_problem is None:
             self.original_problem = {
                 "turn": turn,
                 "domain": domain,
                 "description": description,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": timestamp or _iso_now()
             }
             self.original_domain = domain
 
@@ -45,20 +113,16 @@ class ConversationArc:
     # ---------------------------------------------------------
 
     def record_decision(self, turn, domain, decision, confidence):
-        self.decisions_made.append({
-            "turn": turn,
-            "domain": domain,
-            "decision": decision,
-            "confidence": confidence
-        })
+        entry = Decision(turn, domain, decision, confidence)
+        self.decisions_made.append(entry)
+        self._decisions_by_domain[domain].append(entry)
 
     def detect_decision_contradiction(self, domain, new_decision):
         contradictions = []
 
-        for d in self.decisions_made:
-            if d["domain"] == domain:
-                if self._is_conflicting(d["decision"], new_decision):
-                    contradictions.append(d)
+        for d in self._decisions_by_domain.get(domain, ()):
+            if self._is_conflicting(d.decision, new_decision):
+                contradictions.append(d)
 
         return contradictions
 
@@ -72,12 +136,9 @@ class ConversationArc:
                                     domain,
                                     consequence_magnitude):
 
-        self.consequences.append({
-            "origin_turn": origin_turn,
-            "current_turn": current_turn,
-            "domain": domain,
-            "magnitude": consequence_magnitude
-        })
+        self.consequences.append(Consequence(
+            origin_turn, current_turn, domain, consequence_magnitude
+        ))
 
         if consequence_magnitude > 0.7:
             self.resolution_status = "escalated"
@@ -87,7 +148,7 @@ class ConversationArc:
         long_effects = []
 
         for c in self.consequences:
-            if c["current_turn"] - c["origin_turn"] >= min_turn_gap:
+            if c.current_turn - c.origin_turn >= min_turn_gap:
                 long_effects.append(c)
 
         return long_effects
@@ -97,41 +158,49 @@ class ConversationArc:
     # ---------------------------------------------------------
 
     def register_crisis(self, turn, domain, severity):
-        self.crisis_history.append({
-            "turn_injected": turn,
-            "domain": domain,
-            "severity": severity,
-            "resolved": False
-        })
+        crisis = Crisis(turn, domain, severity)
+        self.crisis_history.append(crisis)
+        self._open_crises_by_domain[domain].append(crisis)
+        self._unresolved_crises += 1
 
     def resolve_crisis(self, domain):
-        for crisis in reversed(self.crisis_history):
-            if crisis["domain"] == domain and not crisis["resolved"]:
-                crisis["resolved"] = True
-                break
-
-        if all(c["resolved"] for c in self.crisis_history):
+        open_crises = self._open_crises_by_domain.get(domain)
+        if open_crises:
+            # Most recent unresolved crisis for the domain, same pick as the
+            # old reversed scan over the full history
+            crisis = open_crises.pop()
+            crisis.resolved = True
+            self._unresolved_crises -= 1
+
+        if self._unresolved_crises == 0:
             self.resolution_status = "resolved"
 
     # ---------------------------------------------------------
     # UNRESOLVED LOOP DETECTION
     # ---------------------------------------------------------
 
+    _LOOP_THRESHOLD = 3
+
     def register_issue_reference(self, domain):
         self.unresolved_issues[domain] += 1
+        if self.unresolved_issues[domain] == self._LOOP_THRESHOLD:
+            self._loop_domains.add(domain)
 
     def detect_unresolved_loop(self, threshold=3):
 
-        loops = []
-
-        for domain, count in self.unresolved_issues.items():
-            if count >= threshold:
-                loops.append({
-                    "domain": domain,
-                    "recurrence": count
-                })
+        if threshold == self._LOOP_THRESHOLD:
+            # Common case: answered from the live set, no dict scan
+            domains = self._loop_domains
+        else:
+            domains = [
+                d for d, count in self.unresolved_issues.items()
+                if count >= threshold
+            ]
 
-        return loops
+        return [
+            {"domain": domain, "recurrence": self.unresolved_issues[domain]}
+            for domain in domains
+        ]
 
     # ---------------------------------------------------------
     # INTERNAL
@@ -139,14 +208,12 @@ class ConversationArc:
 
     def _is_conflicting(self, past_decision, new_decision):
 
-        negative = ["reduce", "cut", "stop", "avoid"]
-        positive = ["increase", "expand", "invest", "accelerate"]
+        past = past_decision.lower()
+        new = new_decision.lower()
 
-        for neg in negative:
-            for pos in positive:
-                if neg in past_decision.lower() and pos in new_decision.lower():
-                    return True
-                if pos in past_decision.lower() and neg in new_decision.lower():
-                    return True
+        past_neg = self._NEG_RE.search(past) is not None
+        past_pos = self._POS_RE.search(past) is not None
+        new_neg = self._NEG_RE.search(new) is not None
+        new_pos = self._POS_RE.search(new) is not None
 
-        return False
+        return (past_neg and new_pos) or (past_pos and new_neg)
@@ -12,13 +12,38 @@ Flow:
 5. Update decision preferences: Next session uses learned patterns
 """
 
+import atexit
+import hashlib
 import json
+import mmap
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 from collections import defaultdict
 
+# Quality-indicator needles compiled once as case-insensitive alternations;
+# one regex scan per message replaces per-needle substring searches over a
+# lowered copy of the text
+_CLARITY_RE = re.compile(r"clarify|confirm|understand|specific about", re.IGNORECASE)
+_SATISFACTION_RE = re.compile(r"satisfied|helpful|clear|good advice", re.IGNORECASE)
+
+# A sentence ending in "?": everything up to the question mark that is not
+# itself sentence punctuation. finditer yields only the question sentences,
+# so no fragments are allocated for the rest of the message.
+_QUESTION_RE = re.compile(r"[^.?!]*\?")
+
+
+@dataclass(slots=True)
+class _HistoryScan:
+    """Everything the analyzers need from one pass over the history."""
+    persona_turns: int = 0
+    user_turns: int = 0
+    clarity_indicators: List[str] = field(default_factory=list)
+    questions_asked: List[str] = field(default_factory=list)
+
 
 class ConversationLearningProcessor:
     """
@@ -32,7 +57,23 @@ class ConversationLearningProcessor:
         self.patterns_file = f"{storage_dir}/domain-patterns.jsonl"
         self.insights_file = f"{storage_dir}/learning-insights.jsonl"
         self.weak_domains_file = f"{storage_dir}/weak-domains.json"
-        
+        self.domain_stats_file = f"{storage_dir}/domain-stats.json"
+
+        # Running per-domain aggregate (satisfied / total / turns_sum).
+        # Loaded once here and updated per conversation, so weak-domain
+        # detection no longer re-parses every past conversation file on
+        # every call.
+        self._domain_stats: Dict[str, Dict[str, int]] = self._load_domain_stats()
+
+        # One append handle for the insights log instead of an open/close
+        # per conversation; closed on interpreter exit
+        self._insights_fp = open(self.insights_file, "a", encoding="utf-8")
+        atexit.register(self._insights_fp.close)
+
+        # Digest of the last weak-domains payload written, so an unchanged
+        # summary skips the rewrite entirely
+        self._last_weak_hash = None
+
     # =====================================================
     # MAIN LEARNING PIPELINE
     # =====================================================
@@ -84,12 +125,15 @@ class ConversationLearningProcessor:
         )
         learning_record["domain_analysis"] = domain_analysis
         
-        # 3. Analyze conversation quality
-        quality_analysis = self._analyze_conversation_quality(conversation_result)
+        # 3+4. One pass over the history feeds both the quality analysis
+        # and the question-pattern extraction
+        history = conversation_result.get("conversation_history", [])
+        scan = self._scan_history(history)
+
+        quality_analysis = self._analyze_conversation_quality(history, scan)
         learning_record["quality_analysis"] = quality_analysis
-        
-        # 4. Extract question patterns
-        question_patterns = self._extract_question_patterns(conversation_result)
+
+        question_patterns = self._extract_question_patterns(conversation_result, scan)
         learning_record["question_patterns"] = question_patterns
         
         # 5. Generate recommendations for next session
@@ -100,7 +144,13 @@ class ConversationLearningProcessor:
         )
         learning_record["recommendations"] = recommendations
         
-        # 6. Identify weak domains across all sessions
+        # 6. Fold this conversation into the running aggregate, then identify
+        # weak domains across all sessions from that aggregate
+        self._update_domain_stats(
+            conversation_result.get("domains", []),
+            conversation_result.get("user_satisfied", False),
+            conversation_result.get("turns", 0),
+        )
         weak_domains = self._identify_weak_domains(session_num)
         learning_record["weak_domains"] = weak_domains
         
@@ -164,9 +214,32 @@ class ConversationLearningProcessor:
         
         return analysis
     
+    def _scan_history(self, history: List[Dict[str, Any]]) -> _HistoryScan:
+        """
+        Single traversal of the conversation history: role counts, clarity
+        indicators, and persona questions all come out of one loop instead
+        of each analyzer re-walking the list.
+        """
+        scan = _HistoryScan()
+        for msg in history:
+            speaker = msg["speaker"]
+            scan.persona_turns += (speaker == "persona")
+            scan.user_turns += (speaker == "user")
+            text = msg["text"]
+            if _CLARITY_RE.search(text):
+                scan.clarity_indicators.append("Clarifying question asked")
+            if _SATISFACTION_RE.search(text):
+                scan.clarity_indicators.append("Satisfaction signal detected")
+            if speaker == "persona" and "?" in text:
+                # Extract sentences with questions
+                for match in _QUESTION_RE.finditer(text):
+                    scan.questions_asked.append(match.group(0).strip()[:150])  # First 150 chars
+        return scan
+
     def _analyze_conversation_quality(
         self,
-        conversation_result: Dict[str, Any]
+        history: List[Dict[str, Any]],
+        scan: _HistoryScan
     ) -> Dict[str, Any]:
         """
         Analyze quality indicators:
@@ -174,30 +247,19 @@ class ConversationLearningProcessor:
         - Was there back-and-forth clarity?
         - Did user express satisfaction?
         """
-        
-        history = conversation_result.get("conversation_history", [])
-        
-        analysis = {
+
+        return {
             "total_exchanges": len(history),
-            "persona_turns": len([h for h in history if h["speaker"] == "persona"]),
-            "user_turns": len([h for h in history if h["speaker"] == "user"]),
+            "persona_turns": scan.persona_turns,
+            "user_turns": scan.user_turns,
             "conversation_depth": len(history) > 4,  # Boolean: multi-turn conversation
-            "clarity_indicators": [],
+            "clarity_indicators": scan.clarity_indicators,
         }
-        
-        # Look for clarity patterns
-        for msg in history:
-            text_lower = msg["text"].lower()
-            if any(q in text_lower for q in ["clarify", "confirm", "understand", "specific about"]):
-                analysis["clarity_indicators"].append("Clarifying question asked")
-            if any(c in text_lower for c in ["satisfied", "helpful", "clear", "good advice"]):
-                analysis["clarity_indicators"].append("Satisfaction signal detected")
-        
-        return analysis
     
     def _extract_question_patterns(
         self,
-        conversation_result: Dict[str, Any]
+        conversation_result: Dict[str, Any],
+        scan: _HistoryScan
     ) -> Dict[str, Any]:
         """
         Extract what types of questions worked well.
@@ -207,18 +269,9 @@ class ConversationLearningProcessor:
         - Which domains benefit from more questions?
         - How many turns until user is satisfied?
         """
-        
-        history = conversation_result.get("conversation_history", [])
-        questions_asked = []
-        
-        for msg in history:
-            if msg["speaker"] == "persona" and "?" in msg["text"]:
-                # Extract sentences with questions
-                sentences = msg["text"].split(".")
-                for sent in sentences:
-                    if "?" in sent:
-                        questions_asked.append(sent.strip()[:150])  # First 150 chars
-        
+
+        questions_asked = scan.questions_asked
+
         return {
             "total_questions": len(questions_asked),
             "question_examples": questions_asked[:3],  # Show first 3 questions
@@ -288,42 +341,81 @@ class ConversationLearningProcessor:
             "domains_to_focus": conversation_result.get("domains", []),
         }
     
+    def _load_domain_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Load the persisted per-domain aggregate, seeding it from the past
+        conversation files once if no aggregate exists yet.
+        """
+        if Path(self.domain_stats_file).exists():
+            try:
+                with open(self.domain_stats_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        # First run (or corrupt aggregate): rebuild from history one time.
+        # os.scandir hands back names and stat info in one pass (no Path
+        # objects per file), and the size check rejects empty/truncated
+        # files before opening them.
+        stats: Dict[str, Dict[str, int]] = {}
+        try:
+            entries = os.scandir("data/conversations")
+        except OSError:
+            return stats
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if entry.stat().st_size <= 2 or not entry.is_file():
+                        continue
+                    with open(entry.path, "rb") as f:
+                        data = json.loads(f.read())
+                except (json.JSONDecodeError, OSError):
+                    continue
+                self._fold_into(
+                    stats,
+                    data.get("domains", []),
+                    data.get("user_satisfied", False),
+                    data.get("turns", 0),
+                )
+        return stats
+
+    @staticmethod
+    def _fold_into(stats, domains, satisfied, turns):
+        for domain in domains:
+            entry = stats.setdefault(
+                domain, {"satisfied": 0, "total": 0, "turns_sum": 0}
+            )
+            entry["total"] += 1
+            entry["turns_sum"] += turns
+            if satisfied:
+                entry["satisfied"] += 1
+
+    def _update_domain_stats(self, domains, satisfied, turns):
+        """Fold one new conversation into the running aggregate and persist it."""
+        self._fold_into(self._domain_stats, domains, satisfied, turns)
+        try:
+            with open(self.domain_stats_file, "w", encoding="utf-8") as f:
+                json.dump(self._domain_stats, f, indent=2)
+        except OSError as e:
+            print(f"[WARNING] Failed to persist domain stats: {e}")
+
     def _identify_weak_domains(self, current_session: int) -> Dict[str, Any]:
         """
         Across all conversations, which domains underperform?
-        
-        Loads all past conversations and computes domain success rates.
+
+        Reads the running aggregate (one entry per domain) instead of
+        re-parsing every past conversation file.
         """
-        
-        domain_stats = defaultdict(lambda: {"satisfied": 0, "total": 0, "avg_turns": []})
-        
-        # Load all past conversation JSONs
-        conv_dir = Path("data/conversations")
-        if conv_dir.exists():
-            for conv_file in conv_dir.glob("*.json"):
-                try:
-                    with open(conv_file, "r") as f:
-                        data = json.load(f)
-                        
-                    domains = data.get("domains", [])
-                    satisfied = data.get("user_satisfied", False)
-                    turns = data.get("turns", 0)
-                    
-                    for domain in domains:
-                        domain_stats[domain]["total"] += 1
-                        if satisfied:
-                            domain_stats[domain]["satisfied"] += 1
-                        domain_stats[domain]["avg_turns"].append(turns)
-                except:
-                    pass
-        
+
         # Compute success rates and identify weak ones
         weak_ones = []
-        for domain, stats in domain_stats.items():
+        for domain, stats in self._domain_stats.items():
             if stats["total"] > 0:
                 success_rate = stats["satisfied"] / stats["total"]
-                avg_turns = sum(stats["avg_turns"]) / len(stats["avg_turns"])
-                
+                avg_turns = stats["turns_sum"] / stats["total"]
+
                 # Consider "weak" if <60% success or >4 avg turns
                 if success_rate < 0.6 or avg_turns > 4:
                     weak_ones.append({
@@ -332,10 +424,10 @@ class ConversationLearningProcessor:
                         "conversations": stats["total"],
                         "avg_turns": f"{avg_turns:.1f}",
                     })
-        
+
         return {
             "weak_domains": sorted(weak_ones, key=lambda x: float(x["success_rate"].rstrip("%")), reverse=True),
-            "total_domains_tracked": len(domain_stats),
+            "total_domains_tracked": len(self._domain_stats),
             "recommendation": "Focus next improvements on domains with <60% success rate"
         }
     
@@ -348,15 +440,21 @@ class ConversationLearningProcessor:
         Save learning insights to disk for future reference.
         """
         try:
-            # Append to learning insights file
-            with open(self.insights_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(learning_record) + "\n")
-            
-            # Update weak domains summary
+            # Append to learning insights file via the persistent handle
+            self._insights_fp.write(json.dumps(learning_record) + "\n")
+
+            # Update weak domains summary only when it actually changed,
+            # via an atomic replace so readers never see a partial file
             weak_domains = learning_record.get("weak_domains", {})
-            with open(self.weak_domains_file, "w", encoding="utf-8") as f:
-                json.dump(weak_domains, f, indent=2)
-                
+            payload = json.dumps(weak_domains, indent=2)
+            weak_hash = hashlib.blake2b(payload.encode(), digest_size=8).digest()
+            if weak_hash != self._last_weak_hash:
+                tmp_path = self.weak_domains_file + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.weak_domains_file)
+                self._last_weak_hash = weak_hash
+
         except Exception as e:
             print(f"[WARNING] Failed to persist learning: {e}")
     
@@ -413,17 +511,30 @@ class ConversationLearningProcessor:
         """
         
         domain_history = []
-        
-        # Load all past insights
+
+        # Load all past insights. The write handle is flushed first so this
+        # sees records appended earlier in the same process, then the file is
+        # memory-mapped and split on newlines — no per-line readline calls.
+        try:
+            self._insights_fp.flush()
+        except ValueError:
+            pass  # handle already closed at interpreter shutdown
         if Path(self.insights_file).exists():
-            with open(self.insights_file, "r") as f:
-                for line in f:
+            with open(self.insights_file, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                        data = bytes(buf)
+                except ValueError:
+                    data = b""  # empty file cannot be mapped
+                for line in data.split(b"\n"):
+                    if not line:
+                        continue
                     try:
                         record = json.loads(line)
-                        if domain in record.get("metrics", {}).get("domains", []):
-                            domain_history.append(record)
-                    except:
-                        pass
+                    except json.JSONDecodeError:
+                        continue
+                    if domain in record.get("metrics", {}).get("domains", []):
+                        domain_history.append(record)
         
         if not domain_history:
             return {"domain": domain, "message": "No prior experience with this domain"}
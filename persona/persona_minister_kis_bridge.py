@@ -14,10 +14,13 @@ Integration Points:
 - Outcome recording hooks for training feedback
 """
 
+import hashlib
 import json
 import logging
+from collections import OrderedDict
+import time
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import sys
 import os
 
@@ -35,6 +38,19 @@ from ml.ml_orchestrator import MLWisdomOrchestrator
 
 logger = logging.getLogger(__name__)
 
+# Second-granularity timestamp cache: recording hot paths stamp many events
+# per second, and each datetime.now().isoformat() allocates a datetime plus
+# a fresh string. Re-format only when the wall-clock second changes.
+_NOW_CACHE = [0, ""]
+
+
+def _now_iso() -> str:
+    sec = time.time_ns() // 1_000_000_000
+    if sec != _NOW_CACHE[0]:
+        _NOW_CACHE[0] = sec
+        _NOW_CACHE[1] = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+    return _NOW_CACHE[1]
+
 
 class MinisterKISBridge:
     """
@@ -61,9 +77,26 @@ class MinisterKISBridge:
         self.orchestrator = orchestrator or MLWisdomOrchestrator(kis_engine=self.kis_engine)
         self.knowledge_base_path = knowledge_base_path
         
-        # Minister → KIS context mapping
-        self.minister_kis_cache: Dict[str, Dict[str, Any]] = {}
-        
+        # Minister → KIS context mapping. Bounded LRU: recorded/queried
+        # entries are moved to the back, and eviction prefers entries whose
+        # outcome is already recorded so in-flight learning data survives
+        # until the hard cap.
+        self.minister_kis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_max = 4096
+        self._cache_hard_max = 8192
+
+        # minister name -> most recent cache_key, so context lookups don't
+        # scan the whole cache
+        self._last_by_minister: Dict[str, str] = {}
+
+        # LRU over synthesis results: when several ministers query the same
+        # (input, domains, confidences) the first call pays for synthesis +
+        # decision logging and the rest reuse the result. Keys are fixed-size
+        # blake2b digests of the request; hits are moved to the back so
+        # recurring questions stay resident across a long session.
+        self._synthesis_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._synthesis_cache_max = 512
+
         logger.info("MinisterKISBridge initialized")
     
     def get_minister_knowledge(
@@ -93,34 +126,56 @@ class MinisterKISBridge:
             }
         """
         
-        # Create KIS request
-        request = KISRequest(
-            user_input=user_input,
-            active_domains=domain_list,
-            domain_confidence=confidence_levels,
-            max_items=max_items
-        )
-        
-        # Synthesize knowledge
-        kis_result = self.kis_engine.synthesize_knowledge(request)
-        
-        # Record in orchestrator for tracking
-        decision_result = self.orchestrator.process_decision(user_input)
-        decision_id = len(self.orchestrator.decisions_log) - 1
-        
+        # One synthesis per distinct request: ministers consulting the same
+        # input/domains in a turn share the result and the logged decision
+        synthesis_key = hashlib.blake2b(
+            user_input.encode()
+            + b"|" + ",".join(sorted(domain_list)).encode()
+            + b"|" + json.dumps(confidence_levels, sort_keys=True).encode()
+            + b"|" + str(max_items).encode(),
+            digest_size=16,
+        ).digest()
+        cached_synthesis = self._synthesis_cache.get(synthesis_key)
+        if cached_synthesis is not None:
+            self._synthesis_cache.move_to_end(synthesis_key)
+            kis_result, decision_id = cached_synthesis
+        else:
+            # Create KIS request
+            request = KISRequest(
+                user_input=user_input,
+                active_domains=domain_list,
+                domain_confidence=confidence_levels,
+                max_items=max_items
+            )
+
+            # Synthesize knowledge
+            kis_result = self.kis_engine.synthesize_knowledge(request)
+
+            # Record in orchestrator for tracking
+            self.orchestrator.process_decision(user_input)
+            decision_id = len(self.orchestrator.decisions_log) - 1
+
+            if len(self._synthesis_cache) >= self._synthesis_cache_max:
+                self._synthesis_cache.popitem(last=False)
+            self._synthesis_cache[synthesis_key] = (kis_result, decision_id)
+
         # Cache for this minister
         cache_key = f"{minister_name}_{decision_id}"
         self.minister_kis_cache[cache_key] = {
             "minister": minister_name,
             "decision_id": decision_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "kis_result": kis_result,
             "user_input": user_input,
         }
-        
+        self._last_by_minister[minister_name] = cache_key
+        self._enforce_cache_bound()
+
+        # Shallow-copy the lists so one minister mutating its view cannot
+        # corrupt the cached result handed to the others
         return {
-            "synthesized_knowledge": kis_result.synthesized_knowledge,
-            "knowledge_trace": kis_result.knowledge_trace,
+            "synthesized_knowledge": list(kis_result.synthesized_knowledge),
+            "knowledge_trace": list(kis_result.knowledge_trace),
             "kis_context": {
                 "quality": kis_result.knowledge_quality,
                 "debug": kis_result.knowledge_debug,
@@ -128,7 +183,33 @@ class MinisterKISBridge:
             "decision_id": decision_id,
             "cache_key": cache_key,
         }
-    
+
+    def _enforce_cache_bound(self):
+        """
+        Cap minister_kis_cache so long DARBAR sessions don't grow it without
+        limit. Oldest entries with a recorded outcome go first; entries still
+        awaiting their outcome are only dropped past the hard cap.
+        """
+        cache = self.minister_kis_cache
+        if len(cache) <= self._cache_max:
+            return
+
+        def _drop(key, entry):
+            if self._last_by_minister.get(entry["minister"]) == key:
+                del self._last_by_minister[entry["minister"]]
+
+        # Completed entries first, oldest to newest
+        for key in [k for k, e in cache.items() if "outcome" in e]:
+            if len(cache) <= self._cache_max:
+                return
+            _drop(key, cache.pop(key))
+
+        # Everything left is still awaiting an outcome; only shed it once
+        # the hard cap is breached
+        while len(cache) > self._cache_hard_max:
+            key, entry = cache.popitem(last=False)
+            _drop(key, entry)
+
     def record_minister_decision(
         self,
         cache_key: str,
@@ -154,11 +235,12 @@ class MinisterKISBridge:
             return False
         
         cached = self.minister_kis_cache[cache_key]
+        self.minister_kis_cache.move_to_end(cache_key)
         cached["decision_recorded"] = {
             "stance": minister_stance,
             "decision": decision_made,
             "confidence": confidence,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
         }
         
         logger.info(f"Decision recorded: {cached['minister']} - {decision_made}")
@@ -191,6 +273,7 @@ class MinisterKISBridge:
             return False
         
         cached = self.minister_kis_cache[cache_key]
+        self.minister_kis_cache.move_to_end(cache_key)
         decision_id = cached["decision_id"]
         
         # Record in orchestrator
@@ -208,7 +291,7 @@ class MinisterKISBridge:
             "regret": regret_score,
             "recovery_days": recovery_time_days,
             "notes": notes,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
         }
         
         logger.info(f"Outcome recorded: {cached['minister']} - {'SUCCESS' if success else 'FAILURE'}")
@@ -225,16 +308,12 @@ class MinisterKISBridge:
         Useful for rendering minister decision explanations.
         """
         
-        contexts = [
-            cache for cache in self.minister_kis_cache.values()
-            if cache["minister"] == minister_name
-        ]
-        
-        if not contexts:
+        # Direct index: the most recent cache_key per minister is maintained
+        # at insertion time, so no scan over the whole cache
+        cache_key = self._last_by_minister.get(minister_name)
+        if cache_key is None:
             return {}
-        
-        # Return most recent
-        return contexts[-1]
+        return self.minister_kis_cache.get(cache_key, {})
     
     def get_learning_summary(self) -> Dict[str, Any]:
         """
@@ -242,10 +321,7 @@ class MinisterKISBridge:
         """
         
         num_decisions = len(self.orchestrator.decisions_log)
-        num_outcomes = sum(
-            1 for d in self.orchestrator.decisions_log
-            if "outcome" in d
-        )
+        num_outcomes = self.orchestrator.outcomes_recorded
         
         # Get ML model state
         if self.orchestrator.ml_prior:
@@ -270,14 +346,26 @@ class MinisterKISBridge:
         """
         
         try:
+            # Stream the cache entry by entry rather than encoding the whole
+            # structure at once: peak memory stays one entry, and skipping
+            # indentation keeps the encoder on its fast path for what can be
+            # thousands of nested KISResult records
             with open(filepath, 'w') as f:
-                data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "minister_cache": self.minister_kis_cache,
-                    "learning_summary": self.get_learning_summary(),
-                }
-                json.dump(data, f, indent=2, default=str)
-            
+                f.write('{"timestamp": ')
+                f.write(json.dumps(_now_iso()))
+                f.write(', "learning_summary": ')
+                json.dump(self.get_learning_summary(), f, default=str)
+                f.write(', "minister_cache": {')
+                first = True
+                for cache_key, entry in self.minister_kis_cache.items():
+                    if not first:
+                        f.write(', ')
+                    first = False
+                    f.write(json.dumps(cache_key))
+                    f.write(': ')
+                    json.dump(entry, f, default=str)
+                f.write('}}')
+
             logger.info(f"Exported minister logs to {filepath}")
             return True
         except Exception as e:
@@ -28,7 +28,18 @@ class CognitiveState:
     last_domain_latched_at_turn: Optional[int] = None
     last_situation: Optional[dict] = None  # IMPROVEMENT: Track last situation for multi-turn context
     last_mode_eval: Optional[dict] = None  # IMPROVEMENT: Track mode fitness for better mode management
-    
+    # Clarification-loop fields (previously set ad hoc by persona.main and read
+    # back via getattr(..., default); declared here so reads are plain loads):
+    awaiting_clarification: bool = False
+    expected_clarification: Optional[dict] = None
+    collected_answers: List[str] = field(default_factory=list)
+    max_clarify_rounds: int = 3
+    last_knowledge_quality: float = 0.0
+    last_coherence: Optional[dict] = None
+    # MCA results from the last turn:
+    last_mca_decision: Optional[dict] = None
+    last_council_recommendation: Optional[Any] = None
+
     # IMPROVEMENT: Methods for better state management
     def add_turn(self, user_prompt: str, assistant_response: str):
         """Add a turn to conversation history with automatic persistence."""
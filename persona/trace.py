@@ -2,9 +2,16 @@
 """
 Simple trace / observer utilities. Controlled via PERSONA_DEBUG environment var.
 Traces are no-op by default to avoid noisy output; turn on for debugging.
+
+Events are kept in a fixed-capacity ring buffer rather than an unbounded list:
+a chatty turn (metrics + MCA + clarify) can emit dozens of events, and a branch
+erroring in a loop previously grew the list without limit. Producers only
+rotate an index and store into a preallocated slot; print_trace() drains the
+ring under a single lock.
 """
 
 import os
+import threading
 from datetime import datetime
 
 env_val = os.getenv("PERSONA_DEBUG", "").lower()
@@ -13,11 +20,56 @@ DEBUG_OBSERVER = env_val in {"1", "true", "yes", "on"}
 # Optional file logging if PERSONA_TRACE_FILE is set (path)
 TRACE_FILE = os.getenv("PERSONA_TRACE_FILE", "").strip()
 
-TRACE = []
+# Ring capacity — enough for several chatty turns between print_trace() calls
+MAX_TRACES = int(os.getenv("PERSONA_MAX_TRACES", "256"))
+
+
+class _TraceRing:
+    """Fixed-capacity ring of trace entries; oldest entries are overwritten."""
+
+    __slots__ = ("buf", "idx", "cap", "total", "_lock")
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.buf = [None] * cap
+        self.idx = 0       # next write slot
+        self.total = 0     # entries pushed since last drain
+        self._lock = threading.Lock()
+
+    def push(self, entry):
+        i = self.idx
+        self.idx = (i + 1) % self.cap
+        self.buf[i] = entry
+        self.total += 1
+
+    def drain(self):
+        """Return entries in insertion order and reset the ring."""
+        with self._lock:
+            n = self.total
+            if n == 0:
+                return []
+            if n >= self.cap:
+                # Wrapped: oldest entry is at the current write index
+                out = self.buf[self.idx:] + self.buf[:self.idx]
+            else:
+                out = self.buf[:self.idx]
+            self.buf = [None] * self.cap
+            self.idx = 0
+            self.total = 0
+            return out
+
+    def __len__(self):
+        return min(self.total, self.cap)
+
+    def __iter__(self):
+        return iter([e for e in self.buf if e is not None])
+
+
+TRACE = _TraceRing(MAX_TRACES)
 
 
 def _append_trace(event, data=None):
-    TRACE.append({"ts": datetime.utcnow().isoformat() + "Z", "event": event, "data": data})
+    TRACE.push({"ts": datetime.utcnow().isoformat() + "Z", "event": event, "data": data})
 
 
 def trace(event, data=None):
@@ -46,12 +98,12 @@ def print_trace():
     Print and clear collected traces. Will only print if DEBUG_OBSERVER is True and there
     are entries.
     """
-    if not DEBUG_OBSERVER or not TRACE:
+    if not DEBUG_OBSERVER or not len(TRACE):
         return
 
+    entries = TRACE.drain()
     print("\n--- OBSERVER TRACE ---")
-    for item in TRACE:
+    for item in entries:
         ts = item.get("ts")
         print(f"[{ts}] [{item['event']}] {item['data']}")
     print("--- END TRACE ---\n")
-    TRACE.clear()
\ No newline at end of file
@@ -31,12 +31,17 @@ class MinisterModuleOutput:
 class MinisterModule:
     """Base class for minister modules."""
     
-    def __init__(self, domain: str, minister_class, llm=None):
+    def __init__(self, domain: str, minister, llm=None):
         self.domain = domain
-        self.minister_name = minister_class.__name__ if minister_class else "Unknown"
-        self.minister_class = minister_class
+        self.minister_name = type(minister).__name__ if minister else "Unknown"
+        self.minister_class = type(minister) if minister else None
         self.llm = llm
-        self.minister = minister_class(domain=domain, llm=llm) if minister_class else None
+        # Reuse the shared minister instance unless a dedicated LLM handle
+        # calls for a private copy
+        if minister and llm is not None:
+            self.minister = type(minister)(domain=domain, llm=llm)
+        else:
+            self.minister = minister
         self.kis_cache = {}
     
     def generate_kis(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -130,11 +135,9 @@ class MinisterModule:
 def create_minister_module(domain: str, llm=None) -> MinisterModule:
     """Create a MinisterModule for a specific domain."""
     if domain in MINISTERS:
-        minister_class = MINISTERS[domain]
-        return MinisterModule(domain, minister_class, llm)
+        return MinisterModule(domain, MINISTERS[domain], llm)
     elif domain in JUDGES:
-        minister_class = JUDGES[domain]
-        return MinisterModule(domain, minister_class, llm)
+        return MinisterModule(domain, JUDGES[domain], llm)
     else:
         raise ValueError(f"Unknown domain: {domain}")
 